@@ -19,7 +19,7 @@ from app.schemas.common import SuccessResponse, ErrorResponse, PaginatedResponse
 from app.schemas.user import UserCreate
 from app.models.user import User
 from app.core.config import settings
-from app.services.s3_service import s3_service
+from app.services.s3_service import get_s3_service
 import logging
 import boto3
 from botocore.config import Config
@@ -36,6 +36,18 @@ def verify_internal_api_key(x_internal_api_key: Optional[str] = Header(None)) ->
     return False
 
 
+async def attach_file_urls(items) -> None:
+    """목록 아이템의 다운로드 URL을 일괄 생성해 모델에 미리 설정 (아이템별 서명/Redis 왕복 방지)"""
+    try:
+        urls = await get_s3_service().generate_presigned_urls_batch_async([item.s3_key for item in items])
+    except Exception as e:
+        # 실패 시 모델 property의 개별 생성 경로로 대체
+        logger.warning(f"Presigned URL 일괄 생성 실패: {e}")
+        return
+    for item in items:
+        item._file_url = urls.get(item.s3_key)
+
+
 async def resolve_current_user(db: AsyncSession, current_user: Optional[User]):
     """현재 사용자 정보 반환 (user_id, nickname)"""
     if current_user:
@@ -81,7 +93,7 @@ async def create_library_item(
         # 동영상인 경우 프리뷰/썸네일 생성 Step Functions 트리거
         execution_arn = None
         if item_in.type == ItemType.video or (item_in.mime_type and item_in.mime_type.startswith('video/')):
-            execution_arn = await s3_service.trigger_video_preview_generation(
+            execution_arn = await get_s3_service().trigger_video_preview_generation(
                 s3_key=item_in.s3_key,
                 item_id=str(item.id)
             )
@@ -156,8 +168,11 @@ async def get_my_library_items(
         deleted_count = 0
         restored_count = 0
         
+        # 존재 여부는 한 번에 조회 (Redis MGET 1회 + 캐시 미스만 head_object, 이벤트 루프 밖에서 실행)
+        exists_by_key = await get_s3_service().files_exist_batch([item.s3_key for item in items])
+        
         for item in items:
-            s3_exists = s3_service.file_exists(item.s3_key)
+            s3_exists = exists_by_key.get(item.s3_key, False)
             
             # S3에 파일이 존재하는 경우
             if s3_exists:
@@ -203,7 +218,8 @@ async def get_my_library_items(
             has_prev=current_page > 1
         )
         
-        # 각 아이템을 응답 형식으로 변환 (file_url은 모델 property에서 자동 생성)
+        # 각 아이템을 응답 형식으로 변환 (file_url은 일괄 생성 후 모델 property에서 사용)
+        await attach_file_urls(valid_items)
         response_items = [LibraryItemResponse.from_orm(item) for item in valid_items]
         
         return PaginatedResponse(
@@ -256,6 +272,8 @@ async def get_public_library_items(
             has_prev=current_page > 1
         )
         
+        await attach_file_urls(items)
+        
         return PaginatedResponse(
             data=[LibraryItemResponse.from_orm(item) for item in items],
             pagination=pagination_info,
@@ -288,7 +306,7 @@ async def get_url_by_s3_key(
         logger.info(f"🔍 만료 시간: {expires_in}초")
         
         # S3 다운로드 URL 생성
-        download_url = await s3_service.generate_presigned_download_url(
+        download_url = await get_s3_service().generate_presigned_download_url(
             s3_key=s3_key,
             expires_in=expires_in
         )
@@ -590,7 +608,6 @@ async def generate_presigned_url(
     - 파일 검증 후 S3 Presigned URL 생성
     """
     try:
-        from app.services.s3_service import s3_service
         from app.services.file_service import file_service
         
         # 업로드 요청 검증
@@ -619,7 +636,7 @@ async def generate_presigned_url(
             user_id = current_user.user_id
             nickname = current_user.nickname or current_user.user_id
 
-        upload_info = await s3_service.generate_presigned_upload_url(
+        upload_info = await get_s3_service().generate_presigned_upload_url(
             filename=request.filename,
             content_type=request.content_type,
             user_id=user_id
@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 from app.api.deps import get_db, get_current_active_user, get_current_user_optional
 from app.core.config import settings
-from app.services.s3_service import s3_service
+from app.services.s3_service import get_s3_service
 from app.services.file_service import file_service
 from app.schemas.library_item import PresignedUrlRequest, PresignedUrlResponse, LibraryItemCreate
 from app.schemas.common import SuccessResponse
@@ -54,7 +54,7 @@ async def generate_real_presigned_url(
             if not settings.DEBUG:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="??? ?????",
+                    detail="인증이 필요합니다",
                 )
             user_id = "test_user"
             username = "test_user"
@@ -62,7 +62,7 @@ async def generate_real_presigned_url(
             user_id = current_user.user_id
             username = current_user.nickname or current_user.user_id
 
-        upload_info = await s3_service.generate_presigned_upload_url(
+        upload_info = await get_s3_service().generate_presigned_upload_url(
             filename=request.filename,
             content_type=request.content_type,
             user_id=user_id
@@ -127,7 +127,7 @@ async def generate_download_url(
             )
         
         # S3 다운로드 URL 생성
-        download_url = await s3_service.generate_presigned_download_url(
+        download_url = await get_s3_service().generate_presigned_download_url(
             s3_key=item.s3_key,
             expires_in=3600  # 1시간
         )
@@ -135,7 +135,7 @@ async def generate_download_url(
         # 썸네일 URL도 함께 생성 (있는 경우)
         thumbnail_url = None
         if item.s3_thumbnail_key:
-            thumbnail_url = await s3_service.generate_presigned_download_url(
+            thumbnail_url = await get_s3_service().generate_presigned_download_url(
                 s3_key=item.s3_thumbnail_key,
                 expires_in=3600
             )
@@ -216,15 +216,15 @@ async def upload_file_and_get_url(
             )
 
         # 1. S3 키 생성
-        s3_key = s3_service.generate_s3_key(file.filename, user_id)
+        s3_key = get_s3_service().generate_s3_key(file.filename, user_id)
         
-        # 2. 파일 내용 읽기
-        file_content = await file.read()
+        # 2. 업로드 파일 처음으로 이동 (메모리에 전체를 읽지 않고 스트리밍)
+        await file.seek(0)
         
-        # 3. S3에 실제 파일 업로드
-        upload_success = await s3_service.upload_file_content(
+        # 3. S3에 실제 파일 업로드 (8MB 초과 시 멀티파트 병렬 업로드)
+        upload_success = await get_s3_service().upload_file_content(
             s3_key=s3_key,
-            file_content=file_content,
+            file_content=file.file,
             content_type=file.content_type,
             metadata={
                 "user-id": user_id,
@@ -256,8 +256,8 @@ async def upload_file_and_get_url(
 
         # 5. 동영상인 경우 프리뷰 생성 Step Functions 트리거
         execution_arn = None
-        if s3_service.is_video_file(file.content_type):
-            execution_arn = await s3_service.trigger_video_preview_generation(
+        if get_s3_service().is_video_file(file.content_type):
+            execution_arn = await get_s3_service().trigger_video_preview_generation(
                 s3_key=s3_key,
                 item_id=str(item.id)
             )
@@ -232,17 +232,8 @@ async def get_users(
             total = await user_crud.count(db)
         
         # 페이지네이션 정보 계산
-        pages = (total + commons.limit - 1) // commons.limit
         current_page = (commons.skip // commons.limit) + 1
-        
-        pagination_info = PaginationInfo(
-            page=current_page,
-            size=commons.limit,
-            total=total,
-            pages=pages,
-            has_next=current_page < pages,
-            has_prev=current_page > 1
-        )
+        pagination_info = PaginationInfo.build(current_page, commons.limit, total)
         
         return PaginatedResponse(
             data=[UserResponse.from_orm(user) for user in users],
@@ -36,6 +36,16 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     
+    # uvicorn 워커 수 (0이면 1, DEBUG 모드는 항상 1)
+    # 워커마다 DB/Redis 풀과 스레드 풀을 따로 가지므로 운영 환경은 파드 CPU/메모리 제한에 맞춰 명시적으로 지정
+    WORKERS: int = 0
+    # 동기 작업용 스레드 풀 크기 (anyio 기본값 40)
+    THREAD_POOL_SIZE: int = 100
+    
+    # 운영 모드(DEBUG=false)에서 시작 시 테이블 자동 생성 여부 (DEBUG 모드는 항상 생성)
+    # 운영 배포는 false 로 두고 배포 전 create_tables.py Job(k8s-create-tables-job.yaml)으로 테이블 생성
+    RUN_MIGRATIONS: bool = False
+    
     # 데이터베이스 설정 (Secrets Manager에서 로드됨)
     DB_HOST: str = ""
     DB_PORT: int = 5432
@@ -69,6 +79,9 @@ class Settings(BaseSettings):
     REDIS_URL: str = ""
     REDIS_TTL: int = 3000  # Presigned URL 캐시 TTL (50분, URL 만료 1시간보다 짧게)
     
+    # 헬스체크 응답 캐시 TTL (초, ALB 반복 프로브 시 DB 조회 생략)
+    HEALTH_CHECK_CACHE_TTL: float = 5.0
+    
     # 백엔드 기본 URL (파일 프록시용)
     BACKEND_BASE_URL: str = "https://api.aws11.shop"
     
@@ -97,6 +110,13 @@ class Settings(BaseSettings):
     def database_url_async(self) -> str:
         """비동기 데이터베이스 URL (FastAPI용)"""
         return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+    
+    @property
+    def worker_count(self) -> int:
+        """uvicorn 워커 수 (reload 는 다중 워커와 함께 쓸 수 없으므로 DEBUG 모드는 1)"""
+        if self.DEBUG:
+            return 1
+        return self.WORKERS or 1
 
 
 # 전역 설정 인스턴스
@@ -195,35 +195,37 @@ class CRUDLibraryItem(CRUDBase[LibraryItem, LibraryItemCreate, LibraryItemUpdate
             return None
         
         # S3 파일 삭제 (소프트 삭제든 영구 삭제든 S3 파일은 삭제)
-        from app.services.s3_service import s3_service
+        from app.services.s3_service import get_s3_service
+        s3_service = get_s3_service()
+        
+        # 삭제할 S3 키 수집 후 delete_objects로 한 번에 삭제
+        keys_to_delete = []
         
         # 메인 파일 삭제
         if item.s3_key:
-            await s3_service.delete_file(item.s3_key)
+            keys_to_delete.append(item.s3_key)
             # 코덱 변환 파일도 삭제 (_h264 버전)
             if item.s3_key.endswith('.mp4'):
-                h264_key = item.s3_key.replace('.mp4', '_h264.mp4')
-                await s3_service.delete_file(h264_key)
+                keys_to_delete.append(item.s3_key.replace('.mp4', '_h264.mp4'))
         
         # 프리뷰 파일 삭제 (있는 경우)
         if item.s3_preview_key:
-            await s3_service.delete_file(item.s3_preview_key)
+            keys_to_delete.append(item.s3_preview_key)
         
         # 썸네일 파일 삭제 (있는 경우)
         if item.s3_thumbnail_key:
-            await s3_service.delete_file(item.s3_thumbnail_key)
+            keys_to_delete.append(item.s3_thumbnail_key)
         
         # 자막 파일 삭제 (있는 경우)
         if item.s3_subtitle_key:
-            await s3_service.delete_file(item.s3_subtitle_key)
+            keys_to_delete.append(item.s3_subtitle_key)
             # 번역본이면 원본도 삭제
             if '_translated.vtt' in item.s3_subtitle_key:
-                original_key = item.s3_subtitle_key.replace('_translated.vtt', '.vtt')
-                await s3_service.delete_file(original_key)
+                keys_to_delete.append(item.s3_subtitle_key.replace('_translated.vtt', '.vtt'))
         
         # Transcribe 결과 파일 삭제 (있는 경우)
         if item.s3_transcribe_key:
-            await s3_service.delete_file(item.s3_transcribe_key)
+            keys_to_delete.append(item.s3_transcribe_key)
         
         # Step Functions 실패 시에도 관련 파일 삭제 시도 (DB에 키가 없는 경우)
         if item.s3_key and item.s3_key.endswith('.mp4'):
@@ -234,24 +236,26 @@ class CRUDLibraryItem(CRUDBase[LibraryItem, LibraryItemCreate, LibraryItemUpdate
             # preview 폴더 (DB에 없으면 예상 경로로 삭제 시도)
             if not item.s3_preview_key:
                 preview_path = base_path.replace('/library/', '/preview/')
-                await s3_service.delete_file(f"{preview_path}/{filename}.mp4")
+                keys_to_delete.append(f"{preview_path}/{filename}.mp4")
             
             # thumbnail 폴더
             if not item.s3_thumbnail_key:
                 thumbnail_path = base_path.replace('/library/', '/thumbnail/')
                 # 썸네일은 .0000000.jpg 형식
-                await s3_service.delete_file(f"{thumbnail_path}/{filename}.0000000.jpg")
+                keys_to_delete.append(f"{thumbnail_path}/{filename}.0000000.jpg")
             
             # subtitle 폴더
             if not item.s3_subtitle_key:
                 subtitle_path = base_path.replace('/library/', '/subtitle/')
-                await s3_service.delete_file(f"{subtitle_path}/{filename}.vtt")
-                await s3_service.delete_file(f"{subtitle_path}/{filename}_translated.vtt")
+                keys_to_delete.append(f"{subtitle_path}/{filename}.vtt")
+                keys_to_delete.append(f"{subtitle_path}/{filename}_translated.vtt")
             
             # transcribe 폴더
             if not item.s3_transcribe_key:
                 transcribe_path = base_path.replace('/library/', '/transcribe/')
-                await s3_service.delete_file(f"{transcribe_path}/subtitle-{item_id}.json")
+                keys_to_delete.append(f"{transcribe_path}/subtitle-{item_id}.json")
+        
+        await s3_service.delete_files(keys_to_delete)
         
         if soft_delete:
             return await self.soft_delete(db, id=item_id)
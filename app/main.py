@@ -4,14 +4,23 @@
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
 from contextlib import asynccontextmanager
+from anyio import to_thread
 from app.core.config import settings
 from app.api.v1.api import api_router
 from app.database.base import test_connection, close_db_connections
+from app.services.s3_service import get_s3_service
 from app.schemas.common import HealthCheckResponse, ErrorResponse
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+import asyncio
 import logging
 import sys
+import time
+import orjson
 
 # OpenTelemetry imports
 from app.core.tracing import setup_tracing
@@ -19,8 +28,7 @@ from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
 
 # SQLAlchemy 테이블 생성을 위한 import
-from sqlalchemy import create_engine
-from app.database.models_config import Base
+from app.database.models_config import Base, async_engine
 # 모든 모델 import (테이블 생성을 위해 필요)
 from app.models.user import User
 from app.models.library_item import LibraryItem
@@ -41,11 +49,10 @@ async def create_tables():
     try:
         logger.info("🔄 데이터베이스 테이블 생성 중...")
         
-        # 동기 엔진 생성 (테이블 생성용)
-        engine = create_engine(settings.database_url_sync)
-        
-        # 모든 테이블 생성 (이미 존재하면 무시)
-        Base.metadata.create_all(bind=engine)
+        # 기존 비동기 엔진 재사용 (별도 커넥션 풀 생성 방지)
+        async with async_engine.begin() as conn:
+            # 모든 테이블 생성 (이미 존재하면 무시)
+            await conn.run_sync(Base.metadata.create_all)
         
         logger.info("✅ 데이터베이스 테이블 생성 완료!")
         logger.info("📊 사용 가능한 테이블:")
@@ -61,7 +68,7 @@ async def create_tables():
 async def lifespan(app: FastAPI):
     """
     애플리케이션 생명주기 관리
-    - 시작 시: 데이터베이스 연결 테스트 및 테이블 생성
+    - 시작 시: 데이터베이스 연결 테스트 및 테이블 생성 (개발/마이그레이션 모드)
     - 종료 시: 리소스 정리
     """
     # 시작 시 실행
@@ -72,14 +79,26 @@ async def lifespan(app: FastAPI):
     HTTPXClientInstrumentor().instrument()
     logger.info("✅ OpenTelemetry Instrumentation 완료")
     
+    # 동기 DB/boto3 경로용 스레드 풀 크기 확장 (운영 모드)
+    if not settings.DEBUG:
+        to_thread.current_default_thread_limiter().total_tokens = settings.THREAD_POOL_SIZE
+        logger.info(f"🧵 스레드 풀 크기: {settings.THREAD_POOL_SIZE}")
+    
     # 데이터베이스 연결 테스트
     db_connected = await test_connection()
     if not db_connected:
         logger.error("❌ 데이터베이스 연결 실패 - 애플리케이션을 종료합니다")
         sys.exit(1)
     
-    # SQLAlchemy로 테이블 자동 생성
-    await create_tables()
+    # SQLAlchemy로 테이블 자동 생성 (개발/마이그레이션 모드에서만)
+    if settings.DEBUG or settings.RUN_MIGRATIONS:
+        await create_tables()
+    else:
+        logger.info("⏭️ RUN_MIGRATIONS=false: 테이블 자동 생성 건너뜀 (테이블은 배포 전 create_tables.py Job 에서 생성)")
+    
+    # OpenAPI 스키마 사전 생성 (직렬화된 bytes로 캐시)
+    app.state.openapi_bytes = orjson.dumps(app.openapi())
+    logger.info("📖 OpenAPI 스키마 캐시 완료")
     
     logger.info("✅ 애플리케이션 초기화 완료")
     
@@ -87,6 +106,7 @@ async def lifespan(app: FastAPI):
     
     # 종료 시 실행
     logger.info("🛑 FastAPI 애플리케이션 종료")
+    await get_s3_service().close()
     await close_db_connections()
     logger.info("✅ 리소스 정리 완료")
 
@@ -103,8 +123,16 @@ app = FastAPI(
 )
 
 # CORS 미들웨어 설정
+# 시작 시 한 번만 정규화: 공백 제거, 빈 항목 제외, frozenset으로 O(1) 포함 검사
+# "*"가 포함되면 ["*"]로 축약하여 CORSMiddleware의 전체 허용 경로 사용
 import os
-allowed_origins = os.getenv("ALLOWED_ORIGINS", "*").split(",")
+allowed_origins = frozenset(
+    origin.strip()
+    for origin in os.getenv("ALLOWED_ORIGINS", "*").split(",")
+    if origin.strip()
+)
+if not allowed_origins or "*" in allowed_origins:
+    allowed_origins = ["*"]
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
@@ -166,6 +194,41 @@ async def library_root():
     }
 
 
+# 헬스체크 응답 캐시 (생성 시각, 응답) - 반복 프로브 시 DB 조회 및 응답 생성 생략
+_health_cache: Optional[Tuple[float, HealthCheckResponse]] = None
+_health_lock = asyncio.Lock()
+
+
+async def _build_health() -> HealthCheckResponse:
+    """
+    헬스체크 응답 생성 (두 헬스체크 라우트 공용)
+    - HEALTH_CHECK_CACHE_TTL 동안 동일한 응답 인스턴스 재사용
+    """
+    global _health_cache
+    
+    cached = _health_cache
+    if cached and time.monotonic() - cached[0] < settings.HEALTH_CHECK_CACHE_TTL:
+        return cached[1]
+    
+    async with _health_lock:
+        # 락 대기 중 다른 요청이 갱신했는지 재확인
+        cached = _health_cache
+        if cached and time.monotonic() - cached[0] < settings.HEALTH_CHECK_CACHE_TTL:
+            return cached[1]
+        
+        # 데이터베이스 연결 상태 확인
+        db_status = "connected" if await test_connection() else "disconnected"
+        
+        response = HealthCheckResponse(
+            status="healthy",
+            timestamp=datetime.now(timezone.utc),
+            version=settings.VERSION,
+            database=db_status
+        )
+        _health_cache = (time.monotonic(), response)
+        return response
+
+
 # 헬스체크 엔드포인트 (ALB 헬스체크용 - /library/health)
 @app.get(
     "/library/health",
@@ -177,15 +240,7 @@ async def library_root():
 async def health_check():
     """헬스체크 API"""
     try:
-        # 데이터베이스 연결 상태 확인
-        db_status = "connected" if await test_connection() else "disconnected"
-        
-        return HealthCheckResponse(
-            status="healthy",
-            timestamp=datetime.utcnow(),
-            version=settings.VERSION,
-            database=db_status
-        )
+        return await _build_health()
     except Exception as e:
         logger.error(f"헬스체크 중 오류: {e}")
         raise HTTPException(
@@ -198,13 +253,7 @@ async def health_check():
 @app.get("/health", include_in_schema=False)
 async def health_check_legacy():
     """레거시 헬스체크 (로컬 테스트용)"""
-    db_status = "connected" if await test_connection() else "disconnected"
-    return HealthCheckResponse(
-        status="healthy",
-        timestamp=datetime.utcnow(),
-        version=settings.VERSION,
-        database=db_status
-    )
+    return await _build_health()
 
 
 # API v1 라우터 포함 (/library 경로 - api/v1 제거)
@@ -213,6 +262,22 @@ app.include_router(
     prefix="/library"
 )
 
+async def cached_openapi(request: Request) -> Response:
+    """캐시된 OpenAPI 스키마 반환 (FastAPI 응답 파이프라인 생략)"""
+    openapi_bytes = getattr(request.app.state, "openapi_bytes", None)
+    if openapi_bytes is None:
+        openapi_bytes = orjson.dumps(request.app.openapi())
+        request.app.state.openapi_bytes = openapi_bytes
+    return Response(openapi_bytes, media_type="application/json")
+
+
+# 기본 OpenAPI 라우트를 캐시된 bytes 응답 라우트로 교체
+app.router.routes = [
+    route for route in app.router.routes
+    if getattr(route, "path", None) != app.openapi_url
+]
+app.router.routes.insert(0, Route(app.openapi_url, cached_openapi, include_in_schema=False))
+
 # FastAPI Instrumentation (OpenTelemetry)
 FastAPIInstrumentor.instrument_app(app)
 
@@ -221,11 +286,14 @@ FastAPIInstrumentor.instrument_app(app)
 if __name__ == "__main__":
     import uvicorn
     
-    logger.info("🔧 개발 모드에서 서버 시작")
+    workers = settings.worker_count
+    
+    logger.info(f"🔧 서버 시작 (워커: {workers})")
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.DEBUG,
+        workers=workers,
         log_level="info" if settings.DEBUG else "warning"
     )
\ No newline at end of file
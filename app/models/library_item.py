@@ -7,9 +7,14 @@ from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.models_config import Base
 from app.core.config import settings
+from datetime import datetime, timezone
+import asyncio
 import uuid
 import enum
 
+# 파일 프록시 URL 접두사 (모듈 로드 시 한 번만 생성)
+FILE_PROXY_URL_PREFIX = f"{settings.BACKEND_BASE_URL}/library/library-items/file/"
+
 
 class ItemType(enum.Enum):
     """라이브러리 아이템 타입 열거형"""
@@ -178,8 +183,13 @@ class LibraryItem(Base):
     @property
     def file_url(self):
         """S3 Presigned URL 생성 (Range 요청 지원)"""
-        from app.services.s3_service import s3_service
-        import asyncio
+        # 목록 조회에서 일괄 생성해 둔 URL이 있으면 사용
+        prefetched_url = getattr(self, "_file_url", None)
+        if prefetched_url:
+            return prefetched_url
+        
+        from app.services.s3_service import get_s3_service
+        s3_service = get_s3_service()
         try:
             # 동기 컨텍스트에서 비동기 함수 호출
             loop = asyncio.get_event_loop()
@@ -192,37 +202,32 @@ class LibraryItem(Base):
                 )
         except Exception:
             # fallback: 프록시 URL
-            from app.core.config import settings
-            return f"{settings.BACKEND_BASE_URL}/library/library-items/file/{self.s3_key}"
+            return FILE_PROXY_URL_PREFIX + self.s3_key
 
     @property
     def thumbnail_url(self):
         """S3 썸네일 프록시 URL 생성"""
         if self.s3_thumbnail_key:
-            from app.core.config import settings
-            return f"{settings.BACKEND_BASE_URL}/library/library-items/file/{self.s3_thumbnail_key}"
+            return FILE_PROXY_URL_PREFIX + self.s3_thumbnail_key
         return None
 
     @property
     def preview_url(self):
         """S3 프리뷰 영상 프록시 URL 생성"""
         if self.s3_preview_key:
-            from app.core.config import settings
-            return f"{settings.BACKEND_BASE_URL}/library/library-items/file/{self.s3_preview_key}"
+            return FILE_PROXY_URL_PREFIX + self.s3_preview_key
         return None
 
     @property
     def subtitle_url(self):
         """S3 자막 파일 프록시 URL 생성"""
         if self.s3_subtitle_key:
-            from app.core.config import settings
-            return f"{settings.BACKEND_BASE_URL}/library/library-items/file/{self.s3_subtitle_key}"
+            return FILE_PROXY_URL_PREFIX + self.s3_subtitle_key
         return None
 
     def soft_delete(self):
         """소프트 삭제 실행"""
-        from datetime import datetime
-        self.deleted_at = datetime.utcnow()
+        self.deleted_at = datetime.now(timezone.utc)
 
     def restore(self):
         """소프트 삭제 복원"""
@@ -70,11 +70,12 @@ class User(Base):
     )
 
     # 관계 설정: 사용자가 소유한 라이브러리 아이템들
+    # lazy="raise": 암묵적 지연 로딩(N+1) 방지, 필요 시 selectinload()로 명시적으로 로드
     library_items = relationship(
         "LibraryItem", 
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="dynamic"
+        lazy="raise"
     )
 
     def __repr__(self):
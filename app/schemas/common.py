@@ -4,6 +4,7 @@
 from pydantic import BaseModel, Field
 from typing import Any, Optional, List, Generic, TypeVar
 from datetime import datetime
+from functools import cached_property
 
 # 제네릭 타입 변수
 T = TypeVar('T')
@@ -50,9 +51,9 @@ class PaginationParams(BaseModel):
     page: int = Field(1, ge=1, description="페이지 번호 (1부터 시작)")
     size: int = Field(20, ge=1, le=100, description="페이지 크기 (1-100)")
     
-    @property
+    @cached_property
     def offset(self) -> int:
-        """데이터베이스 OFFSET 계산"""
+        """데이터베이스 OFFSET 계산 (최초 접근 시 한 번만 계산)"""
         return (self.page - 1) * self.size
 
 
@@ -68,6 +69,22 @@ class PaginationInfo(BaseModel):
     has_next: bool = Field(description="다음 페이지 존재 여부")
     has_prev: bool = Field(description="이전 페이지 존재 여부")
 
+    @classmethod
+    def build(cls, page: int, size: int, total: int) -> "PaginationInfo":
+        """
+        페이지 번호, 크기, 전체 항목 수로부터 페이지네이션 정보 생성
+        - 전체 페이지 수와 이전/다음 페이지 여부를 한 번에 계산
+        """
+        pages = (total + size - 1) // size
+        return cls(
+            page=page,
+            size=size,
+            total=total,
+            pages=pages,
+            has_next=page < pages,
+            has_prev=page > 1
+        )
+
 
 class PaginatedResponse(BaseResponse, Generic[T]):
     """
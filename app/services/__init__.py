@@ -8,7 +8,7 @@
 - 기타 외부 API 연동 서비스
 """
 
-from .s3_service import s3_service
+from .s3_service import get_s3_service
 from .file_service import file_service
 
-__all__ = ["s3_service", "file_service"]
\ No newline at end of file
+__all__ = ["get_s3_service", "file_service"]
\ No newline at end of file
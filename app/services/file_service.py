@@ -2,12 +2,162 @@
 # 파일 처리 서비스
 
 import mimetypes
-from typing import Optional, Dict, Any, Tuple
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Tuple, Mapping
 from app.models.library_item import ItemType
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 파일 크기 표시 단위 (1024배 단위)
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+# 자주 쓰는 확장자 → MIME 타입 (mimetypes 초기화/시스템 mime.types 조회 없이 바로 결정)
+_EXT_TO_MIME: Mapping[str, str] = MappingProxyType({
+    # 이미지
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'png': 'image/png',
+    'gif': 'image/gif',
+    'webp': 'image/webp',
+    'svg': 'image/svg+xml',
+    'bmp': 'image/bmp',
+    'tif': 'image/tiff',
+    'tiff': 'image/tiff',
+    
+    # 비디오
+    'mp4': 'video/mp4',
+    'mpeg': 'video/mpeg',
+    'mpg': 'video/mpeg',
+    'mov': 'video/quicktime',
+    'avi': 'video/x-msvideo',
+    'webm': 'video/webm',
+    'flv': 'video/x-flv',
+    '3gp': 'video/3gpp',
+    
+    # 문서
+    'pdf': 'application/pdf',
+    'doc': 'application/msword',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'xls': 'application/vnd.ms-excel',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'ppt': 'application/vnd.ms-powerpoint',
+    'pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+    'txt': 'text/plain',
+    'html': 'text/html',
+    'htm': 'text/html',
+    'css': 'text/css',
+    'js': 'text/javascript',
+    'json': 'application/json',
+    'xml': 'application/xml',
+    'csv': 'text/csv',
+    'rtf': 'application/rtf',
+})
+
+
+@lru_cache(maxsize=4096)
+def _guess_by_ext(ext: str) -> str:
+    """확장자(소문자, 점 제외)로 MIME 타입 조회 (결과 캐시)"""
+    mime_type, _ = mimetypes.guess_type(f"x.{ext}")
+    return mime_type or 'application/octet-stream'
+
+
+def _mime_for_ext(ext: str) -> str:
+    """확장자로 MIME 타입 결정 (사전 정의 테이블 우선, 없으면 mimetypes)"""
+    return _EXT_TO_MIME.get(ext) or _guess_by_ext(ext)
+
+
+# MIME 타입별 아이템 타입 매핑 (읽기 전용, 워커 fork 시 공유)
+MIME_TYPE_MAPPING: Mapping[str, ItemType] = MappingProxyType({
+    # 이미지
+    'image/jpeg': ItemType.image,
+    'image/jpg': ItemType.image,
+    'image/png': ItemType.image,
+    'image/gif': ItemType.image,
+    'image/webp': ItemType.image,
+    'image/svg+xml': ItemType.image,
+    'image/bmp': ItemType.image,
+    'image/tiff': ItemType.image,
+    
+    # 비디오
+    'video/mp4': ItemType.video,
+    'video/mpeg': ItemType.video,
+    'video/quicktime': ItemType.video,
+    'video/x-msvideo': ItemType.video,  # .avi
+    'video/webm': ItemType.video,
+    'video/x-flv': ItemType.video,
+    'video/3gpp': ItemType.video,
+    
+    # 문서
+    'application/pdf': ItemType.document,
+    'application/msword': ItemType.document,
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': ItemType.document,  # .docx
+    'application/vnd.ms-excel': ItemType.document,
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': ItemType.document,  # .xlsx
+    'application/vnd.ms-powerpoint': ItemType.document,
+    'application/vnd.openxmlformats-officedocument.presentationml.presentation': ItemType.document,  # .pptx
+    'text/plain': ItemType.document,
+    'text/html': ItemType.document,
+    'text/css': ItemType.document,
+    'text/javascript': ItemType.document,
+    'application/json': ItemType.document,
+    'application/xml': ItemType.document,
+    'text/xml': ItemType.document,
+    'text/csv': ItemType.document,
+    'application/rtf': ItemType.document,
+})
+
+# application/* 타입 전용 매핑 (image/video/text는 접두사로 판별)
+_APPLICATION_MIME_MAP: Mapping[str, ItemType] = MappingProxyType({
+    mime: item_type for mime, item_type in MIME_TYPE_MAPPING.items()
+    if mime.startswith('application/')
+})
+
+# 파일 크기 제한 (바이트)
+SIZE_LIMITS: Mapping[ItemType, int] = MappingProxyType({
+    ItemType.image: 50 << 20,     # 50MB
+    ItemType.video: 2 << 30,      # 2GB
+    ItemType.document: 100 << 20,  # 100MB
+    ItemType.file: 2 << 30,       # 2GB
+})
+
+# 타입별 (최대 크기, 에러 메시지) 사전 계산
+_SIZE_LIMIT_TABLE: Mapping[ItemType, Tuple[int, str]] = MappingProxyType({
+    item_type: (limit, f"{item_type.value} 파일은 최대 {limit >> 20}MB까지 업로드 가능합니다")
+    for item_type, limit in SIZE_LIMITS.items()
+})
+
+# 정의되지 않은 타입의 기본 제한 (매 호출마다 조회하지 않도록 미리 꺼내 둠)
+_DEFAULT_SIZE_LIMIT: Tuple[int, str] = _SIZE_LIMIT_TABLE[ItemType.file]
+
+
+def _split_ext(filename: str) -> str:
+    """파일명에서 확장자 추출 (소문자, 점 제외, 없으면 빈 문자열)"""
+    _, sep, ext = filename.rpartition('.')
+    return ext.lower() if sep else ''
+
+
+def _item_type_for_mime(mime_type: str) -> ItemType:
+    """MIME 타입으로 아이템 타입 결정 (대부분 최상위 타입만으로 결정)"""
+    if mime_type.startswith('image/'):
+        return ItemType.image
+    if mime_type.startswith('video/'):
+        return ItemType.video
+    if mime_type.startswith('text/'):
+        return ItemType.document
+    return _APPLICATION_MIME_MAP.get(mime_type, ItemType.file)
+
+
+@lru_cache(maxsize=1024)
+def _ext_to_item_type(ext: str) -> ItemType:
+    """확장자로 아이템 타입 결정 (결과 캐시)"""
+    if not ext:
+        return ItemType.file
+    return _item_type_for_mime(_mime_for_ext(ext))
+
 
 class FileService:
     """
@@ -17,55 +167,24 @@ class FileService:
     - 파일 크기 검증
     """
 
+    # 업로드 차단 MIME 타입 (해시 조회)
+    _BLOCKED_MIMES: frozenset = frozenset({
+        'application/x-executable',
+        'application/x-msdownload',
+        'application/x-msdos-program',
+    })
+
+    # 썸네일 생성 대상 아이템 타입
+    _THUMB_TYPES: frozenset = frozenset((ItemType.image, ItemType.video))
+
     def __init__(self):
         """파일 서비스 초기화"""
-        # MIME 타입별 아이템 타입 매핑
-        self.mime_type_mapping = {
-            # 이미지
-            'image/jpeg': ItemType.image,
-            'image/jpg': ItemType.image,
-            'image/png': ItemType.image,
-            'image/gif': ItemType.image,
-            'image/webp': ItemType.image,
-            'image/svg+xml': ItemType.image,
-            'image/bmp': ItemType.image,
-            'image/tiff': ItemType.image,
-            
-            # 비디오
-            'video/mp4': ItemType.video,
-            'video/mpeg': ItemType.video,
-            'video/quicktime': ItemType.video,
-            'video/x-msvideo': ItemType.video,  # .avi
-            'video/webm': ItemType.video,
-            'video/x-flv': ItemType.video,
-            'video/3gpp': ItemType.video,
-            
-            # 문서
-            'application/pdf': ItemType.document,
-            'application/msword': ItemType.document,
-            'application/vnd.openxmlformats-officedocument.wordprocessingml.document': ItemType.document,  # .docx
-            'application/vnd.ms-excel': ItemType.document,
-            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': ItemType.document,  # .xlsx
-            'application/vnd.ms-powerpoint': ItemType.document,
-            'application/vnd.openxmlformats-officedocument.presentationml.presentation': ItemType.document,  # .pptx
-            'text/plain': ItemType.document,
-            'text/html': ItemType.document,
-            'text/css': ItemType.document,
-            'text/javascript': ItemType.document,
-            'application/json': ItemType.document,
-            'application/xml': ItemType.document,
-            'text/xml': ItemType.document,
-            'text/csv': ItemType.document,
-            'application/rtf': ItemType.document,
-        }
+        # 모듈 상수 공유 (인스턴스마다 딕셔너리를 만들지 않음)
+        self.mime_type_mapping = MIME_TYPE_MAPPING
+        self.size_limits = SIZE_LIMITS
         
-        # 파일 크기 제한 (바이트)
-        self.size_limits = {
-            ItemType.image: 50 * 1024 * 1024,      # 50MB
-            ItemType.video: 2 * 1024 * 1024 * 1024,  # 2GB
-            ItemType.document: 100 * 1024 * 1024,  # 100MB
-            ItemType.file: 2 * 1024 * 1024 * 1024,   # 2GB
-        }
+        # 파일명 금지 문자 패턴 (한 번의 스캔으로 검사)
+        self._forbidden_re = re.compile(r'[<>:"|?*\\/]')
 
     def detect_mime_type(self, filename: str) -> str:
         """
@@ -77,8 +196,10 @@ class FileService:
         Returns:
             MIME 타입
         """
-        mime_type, _ = mimetypes.guess_type(filename)
-        return mime_type or 'application/octet-stream'
+        ext = _split_ext(filename)
+        if not ext:
+            return 'application/octet-stream'
+        return _mime_for_ext(ext)
 
     def get_item_type_from_mime(self, mime_type: str) -> ItemType:
         """
@@ -90,7 +211,7 @@ class FileService:
         Returns:
             아이템 타입
         """
-        return self.mime_type_mapping.get(mime_type, ItemType.file)
+        return _item_type_for_mime(mime_type)
 
     def get_item_type_from_filename(self, filename: str) -> ItemType:
         """
@@ -102,8 +223,7 @@ class FileService:
         Returns:
             아이템 타입
         """
-        mime_type = self.detect_mime_type(filename)
-        return self.get_item_type_from_mime(mime_type)
+        return _ext_to_item_type(_split_ext(filename))
 
     def validate_file_size(self, file_size: int, item_type: ItemType) -> Tuple[bool, Optional[str]]:
         """
@@ -116,11 +236,10 @@ class FileService:
         Returns:
             (검증 성공 여부, 에러 메시지)
         """
-        max_size = self.size_limits.get(item_type, self.size_limits[ItemType.file])
+        max_size, error_msg = _SIZE_LIMIT_TABLE.get(item_type, _DEFAULT_SIZE_LIMIT)
         
         if file_size > max_size:
-            max_size_mb = max_size / (1024 * 1024)
-            return False, f"{item_type.value} 파일은 최대 {max_size_mb:.0f}MB까지 업로드 가능합니다"
+            return False, error_msg
         
         if file_size <= 0:
             return False, "파일 크기가 유효하지 않습니다"
@@ -145,10 +264,9 @@ class FileService:
             return False, "파일명이 너무 깁니다 (최대 255자)"
         
         # 금지된 문자 확인
-        forbidden_chars = ['<', '>', ':', '"', '|', '?', '*', '\\', '/']
-        for char in forbidden_chars:
-            if char in filename:
-                return False, f"파일명에 사용할 수 없는 문자가 포함되어 있습니다: {char}"
+        match = self._forbidden_re.search(filename)
+        if match:
+            return False, f"파일명에 사용할 수 없는 문자가 포함되어 있습니다: {match.group(0)}"
         
         return True, None
 
@@ -184,14 +302,11 @@ class FileService:
         Returns:
             포맷된 파일 크기 문자열
         """
-        if size_bytes < 1024:
+        # 비트 길이로 단위 인덱스 결정 (1024 = 2^10 단위)
+        idx = min((size_bytes.bit_length() - 1) // 10, len(SIZE_UNITS) - 1) if size_bytes > 0 else 0
+        if not idx:
             return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+        return f"{size_bytes / (1 << (10 * idx)):.1f} {SIZE_UNITS[idx]}"
 
     def get_file_extension(self, filename: str) -> str:
         """
@@ -203,9 +318,8 @@ class FileService:
         Returns:
             파일 확장자 (점 포함)
         """
-        if '.' in filename:
-            return '.' + filename.split('.')[-1].lower()
-        return ''
+        _, sep, ext = filename.rpartition('.')
+        return '.' + ext.lower() if sep else ''
 
     def is_supported_file_type(self, mime_type: str) -> bool:
         """
@@ -218,13 +332,7 @@ class FileService:
             지원 여부
         """
         # 모든 파일 타입을 지원하지만, 특정 타입은 제외
-        blocked_types = [
-            'application/x-executable',
-            'application/x-msdownload',
-            'application/x-msdos-program',
-        ]
-        
-        return mime_type not in blocked_types
+        return mime_type not in self._BLOCKED_MIMES
 
     def validate_upload_request(
         self,
@@ -245,27 +353,39 @@ class FileService:
         Returns:
             (검증 성공 여부, 에러 메시지, 파일 정보)
         """
+        # 개별 검증 메서드를 한 번에 수행 (아이템 타입은 한 번만 계산)
+        
         # 파일명 검증
-        valid, error = self.validate_filename(filename)
-        if not valid:
-            return False, error, {}
+        if not filename or not filename.strip():
+            return False, "파일명이 비어있습니다", {}
         
-        # MIME 타입 검증
-        valid, error = self.validate_mime_type(content_type, expected_type)
-        if not valid:
-            return False, error, {}
+        if len(filename) > 255:
+            return False, "파일명이 너무 깁니다 (최대 255자)", {}
         
-        # 지원되는 파일 타입인지 확인
-        if not self.is_supported_file_type(content_type):
-            return False, "지원되지 않는 파일 타입입니다", {}
+        match = self._forbidden_re.search(filename)
+        if match:
+            return False, f"파일명에 사용할 수 없는 문자가 포함되어 있습니다: {match.group(0)}", {}
+        
+        # MIME 타입 검증 및 아이템 타입 결정
+        if not content_type:
+            return False, "MIME 타입이 지정되지 않았습니다", {}
         
-        # 아이템 타입 결정
         item_type = self.get_item_type_from_mime(content_type)
         
+        if expected_type and item_type != expected_type:
+            return False, f"파일 타입이 일치하지 않습니다. 예상: {expected_type.value}, 실제: {item_type.value}", {}
+        
+        # 지원되는 파일 타입인지 확인
+        if content_type in self._BLOCKED_MIMES:
+            return False, "지원되지 않는 파일 타입입니다", {}
+        
         # 파일 크기 검증
-        valid, error = self.validate_file_size(file_size, item_type)
-        if not valid:
-            return False, error, {}
+        max_size, error_msg = _SIZE_LIMIT_TABLE.get(item_type, _DEFAULT_SIZE_LIMIT)
+        if file_size > max_size:
+            return False, error_msg, {}
+        
+        if file_size <= 0:
+            return False, "파일 크기가 유효하지 않습니다", {}
         
         # 파일 정보 생성
         file_info = {
@@ -274,7 +394,7 @@ class FileService:
             "file_size": file_size,
             "formatted_size": self.format_file_size(file_size),
             "file_extension": self.get_file_extension(filename),
-            "needs_thumbnail": item_type in [ItemType.image, ItemType.video]
+            "needs_thumbnail": item_type in self._THUMB_TYPES
         }
         
         return True, None, file_info
@@ -1,16 +1,29 @@
 # 📁 app/services/s3_service.py
 # AWS S3 파일 업로드 서비스 (IRSA 사용) + Redis 캐싱
 
+import asyncio
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
-import uuid
-import json
+import hashlib
+import hmac
+import io
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from functools import cache, cached_property, partial
+from urllib.parse import quote
+from typing import Optional, Dict, Any, BinaryIO, List, Set, Tuple, Union
 from botocore.exceptions import ClientError, NoCredentialsError
 from app.core.config import settings
 import logging
+import orjson
 import redis
+from redis.backoff import ExponentialBackoff
+from redis.retry import Retry
+from cachetools import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -18,18 +31,150 @@ logger = logging.getLogger(__name__)
 redis_client = None
 if settings.REDIS_URL:
     try:
-        redis_client = redis.from_url(
+        # 커넥션 풀 + 재시도(지수 백오프) + keep-alive + 주기적 헬스 체크
+        # - 타임아웃 1초: Redis 장애 시 요청이 줄줄이 막히지 않도록
+        redis_client = redis.Redis(connection_pool=redis.ConnectionPool.from_url(
             f"rediss://{settings.REDIS_URL}",  # rediss:// = TLS 사용
-            decode_responses=True,
-            socket_timeout=5,
-            socket_connect_timeout=5
-        )
+            max_connections=64,
+            socket_keepalive=True,
+            socket_timeout=1,
+            socket_connect_timeout=1,
+            health_check_interval=30,
+            retry_on_timeout=True,
+            retry=Retry(ExponentialBackoff(cap=1, base=0.1), 5),
+            decode_responses=True
+        ))
         redis_client.ping()
         logger.info(f"✅ Redis 연결 성공: {settings.REDIS_URL}")
     except Exception as e:
         logger.warning(f"⚠️ Redis 연결 실패, 캐싱 비활성화: {e}")
         redis_client = None
 
+# 공유 boto3 세션 (서비스 모델/엔드포인트 데이터 로드를 한 번만 수행)
+_boto_session = boto3.session.Session()
+
+# delete_objects 요청당 최대 키 개수 (S3 제한)
+DELETE_BATCH_SIZE = 1000
+
+# 다운로드 URL 로컬 캐시 ((s3_key, 만료 분 단위) -> URL, 5분) - Redis 앞단 1차 캐시
+# - 짧은 시간 내 같은 객체를 반복 요청하면 Redis 왕복/재서명 없이 동일 URL 반환
+# - 동기 경로는 여러 스레드에서 호출될 수 있으므로 락으로 보호
+LOCAL_URL_CACHE_TTL = 300
+
+# 캐시에서 꺼낸 URL이 최소한 보장해야 하는 남은 유효 시간 (초)
+URL_EXPIRY_SAFETY_MARGIN = 300
+
+
+def _url_cache_ttl(expires_in: int) -> int:
+    """
+    Redis URL 캐시 TTL 계산 (캐시 TTL < 서명 만료)
+    - Redis에서 꺼낸 URL이 로컬 캐시에 추가로 머무는 시간까지 고려해
+      전달 시점에 최소 URL_EXPIRY_SAFETY_MARGIN초 이상 유효하도록 보장
+    - 0 이하이면 캐시하지 않음
+    """
+    return min(settings.REDIS_TTL, expires_in - URL_EXPIRY_SAFETY_MARGIN - LOCAL_URL_CACHE_TTL)
+
+
+# 썸네일 생성 대상 MIME 최상위 타입
+_THUMBNAIL_MAJOR_TYPES = frozenset({"image", "video"})
+
+# head_object 결과 Redis 캐시 TTL (초, 존재하는 파일만 캐시)
+HEAD_CACHE_TTL = 300
+
+# 지연 저장할 Redis SETEX 최대 개수 (초과 시 즉시 전송)
+PENDING_URL_WRITE_LIMIT = 16
+_local_url_cache: TTLCache = TTLCache(maxsize=50_000, ttl=LOCAL_URL_CACHE_TTL)
+_local_url_cache_lock = threading.RLock()
+
+
+def _local_url_get(s3_key: str, expires_in: int) -> Optional[str]:
+    """로컬 캐시에서 다운로드 URL 조회 (만료 시간은 분 단위로 묶어 키 공유)"""
+    with _local_url_cache_lock:
+        return _local_url_cache.get((s3_key, expires_in // 60))
+
+
+def _local_url_put(s3_key: str, expires_in: int, url: str) -> None:
+    """로컬 캐시에 다운로드 URL 저장 (URL 만료가 캐시 TTL보다 짧으면 저장하지 않음)"""
+    if expires_in <= LOCAL_URL_CACHE_TTL:
+        return
+    with _local_url_cache_lock:
+        _local_url_cache[(s3_key, expires_in // 60)] = url
+
+# S3 클라이언트 공통 설정
+# signature_version='s3v4' 필수: IRSA Presigned URL 서명 검증을 위해 필요
+# - 커넥션 풀 64개: 스레드 풀/동시 요청에서 "Connection pool is full"로 직렬화되지 않도록
+# - keep-alive + 짧은 연결 타임아웃, standard 재시도 모드
+_S3_CLIENT_CONFIG = Config(
+    signature_version='s3v4',
+    s3={"addressing_style": "virtual"},
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    retries={"mode": "standard", "max_attempts": 3},
+    connect_timeout=2,
+    read_timeout=10
+)
+
+# 멀티파트 업로드 기준/청크 크기 (8MB 초과 시 청크 병렬 업로드)
+MULTIPART_THRESHOLD = 8 << 20
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    multipart_chunksize=8 << 20,
+    max_concurrency=8,
+    use_threads=True
+)
+
+# 블로킹 boto3 호출 전용 스레드 풀 (업로드 폭주 시 기본 풀의 다른 I/O가 밀리지 않도록 분리)
+S3_IO_MAX_WORKERS = 32
+_s3_executor = ThreadPoolExecutor(max_workers=S3_IO_MAX_WORKERS, thread_name_prefix="s3-io")
+
+
+# 다운로드 URL 서명 + Redis 캐시 조회 전용 스레드 풀 (이벤트 루프에서 블로킹 Redis 호출 제거)
+_SIGN_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="s3-sign")
+
+
+async def _run_blocking(func, *args, **kwargs):
+    """블로킹 boto3 호출을 S3 전용 스레드 풀에서 실행"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_s3_executor, partial(func, *args, **kwargs))
+
+
+def _hmac_sha256(key: bytes, msg: str) -> bytes:
+    """HMAC-SHA256 다이제스트"""
+    return hmac.new(key, msg.encode("utf-8"), hashlib.sha256).digest()
+
+
+def _derive_signing_key(secret_key: str, date_stamp: str, region: str) -> bytes:
+    """SigV4 서명 키 생성 (kDate → kRegion → kService → kSigning)"""
+    k_date = _hmac_sha256(("AWS4" + secret_key).encode("utf-8"), date_stamp)
+    k_region = _hmac_sha256(k_date, region)
+    k_service = _hmac_sha256(k_region, "s3")
+    return _hmac_sha256(k_service, "aws4_request")
+
+
+def _uri_encode(value: str, safe: str = "-_.~") -> str:
+    """SigV4 규칙에 맞는 URI 인코딩"""
+    return quote(value, safe=safe)
+
+
+# S3 키 연/월 경로 캐시 {"val": (분 단위 타임스탬프, "YYYY/MM")} - 분이 바뀔 때만 다시 계산
+_MONTH_CACHE: Dict[str, Tuple[int, str]] = {"val": (-1, "")}
+
+
+def _current_month_path() -> str:
+    """현재 UTC 연/월 경로 ("YYYY/MM") 반환 (1분 단위 캐시)"""
+    now_min = int(time.time()) // 60
+    cached_min, month_path = _MONTH_CACHE["val"]
+    if cached_min != now_min:
+        now = time.gmtime(now_min * 60)
+        month_path = f"{now.tm_year}/{now.tm_mon:02d}"
+        # 튜플 한 번에 교체 (스레드 간 일관성 유지)
+        _MONTH_CACHE["val"] = (now_min, month_path)
+    return month_path
+
+
+# 다운로드 URL 고정 쿼리 파라미터 (미리 인코딩)
+_RESPONSE_CACHE_CONTROL_PARAM = "&response-cache-control=" + _uri_encode("max-age=3600")
+
 
 class S3Service:
     """
@@ -40,44 +185,65 @@ class S3Service:
     """
     
     def __init__(self):
-        """S3 클라이언트 초기화 (IRSA 사용)"""
+        """S3 서비스 초기화 (클라이언트는 첫 S3 호출 시 생성)"""
+        self.region = settings.S3_REGION
+        self.bucket_name = settings.S3_BUCKET_NAME
+        # 로컬 SigV4 서명용 값 (호스트/리전은 고정, 자격 증명은 갱신 시에만 교체)
+        self._s3_host = f"{self.bucket_name}.s3.{self.region}.amazonaws.com"
+        self._encoded_region = _uri_encode(self.region)
+        # (고정 자격 증명, 인코딩된 Access Key, 토큰 파라미터, 일별 서명 키 캐시)
+        # - 서명 키 캐시(YYYYMMDD -> key)는 자격 증명 스냅샷마다 따로 두어 갱신 시 함께 교체
+        self._signing_creds: Optional[Tuple[Any, str, str, Dict[str, bytes]]] = None
+        # 다음 Redis 조회 파이프라인에 함께 보낼 SETEX 버퍼 [(cache_key, 캐시 만료 시각(monotonic), url)]
+        self._pending_url_writes: List[Tuple[str, float, str]] = []
+        self._pending_url_writes_lock = threading.Lock()
+        # 다운로드 URL 키별 락 (동시 요청 시 서명은 한 번만)
+        self._url_locks: Dict[tuple, asyncio.Lock] = {}
+
+    async def close(self) -> None:
+        """대기 중인 URL 캐시 저장 (애플리케이션 종료 시 호출)"""
+        self.flush_pending_url_writes()
+
+    @cached_property
+    def s3_client(self):
+        """S3 클라이언트 지연 생성 (IRSA 사용)"""
         try:
             # IRSA 사용 - Access Key 없이 IAM Role로 인증
-            # signature_version='s3v4' 필수: IRSA Presigned URL 서명 검증을 위해 필요
-            self.region = settings.S3_REGION
-            self.s3_client = boto3.client(
+            client = _boto_session.client(
                 "s3",
                 region_name=self.region,
                 endpoint_url=f"https://s3.{self.region}.amazonaws.com",
-                config=Config(
-                    signature_version='s3v4',
-                    s3={"addressing_style": "virtual"}
-                ),
+                config=_S3_CLIENT_CONFIG,
             )
-            self.bucket_name = settings.S3_BUCKET_NAME
             logger.info(f"✅ S3 클라이언트 초기화 완료 (버킷: {self.bucket_name}, 리전: {self.region}, signature: s3v4)")
+            return client
         except NoCredentialsError:
             logger.warning("⚠️ AWS 자격 증명이 설정되지 않음 - 개발 모드로 실행")
-            self.s3_client = None
-            self.bucket_name = settings.S3_BUCKET_NAME
+            return None
         except Exception as e:
             logger.error(f"❌ S3 클라이언트 초기화 실패: {e}")
-            self.s3_client = None
-            self.bucket_name = settings.S3_BUCKET_NAME
+            return None
+
+    @cached_property
+    def sfn_client(self):
+        """Step Functions 클라이언트 지연 생성 (공유 세션에서 한 번만 생성)"""
+        try:
+            return _boto_session.client('stepfunctions', region_name=self.region)
+        except Exception as e:
+            logger.error(f"❌ Step Functions 클라이언트 초기화 실패: {e}")
+            return None
 
     def generate_s3_key(self, filename: str, user_id: str) -> str:
         """
         S3 키 생성 (파일 경로)
         
-        형식: {user_id}/library/{년도}/{월}/{uuid}.{확장자}
-        예시: 14780408-6031-704d-19af-ab1893f6b8e5/library/2026/01/550e8400-e29b-41d4.jpg
+        형식: {user_id}/library/{년도}/{월}/{랜덤 32자 hex}.{확장자(소문자)}
+        예시: 14780408-6031-704d-19af-ab1893f6b8e5/library/2026/01/550e8400e29b41d4a716446655440000.jpg
         """
-        now = datetime.utcnow()
-        file_extension = filename.split('.')[-1] if '.' in filename else ''
-        unique_filename = f"{uuid.uuid4()}.{file_extension}" if file_extension else str(uuid.uuid4())
+        _, sep, ext = filename.rpartition('.')
+        suffix = f".{ext.lower()}" if sep and ext else ''
         
-        s3_key = f"{user_id}/library/{now.year}/{now.month:02d}/{unique_filename}"
-        return s3_key
+        return f"{user_id}/library/{_current_month_path()}/{secrets.token_hex(16)}{suffix}"
 
     def generate_thumbnail_key(self, s3_key: str) -> str:
         """
@@ -86,16 +252,104 @@ class S3Service:
         형식: {user_id}/library/{년도}/{월}/thumbs/{uuid}_thumb.{확장자}
         예시: 14780408-6031-704d-19af-ab1893f6b8e5/library/2026/01/thumbs/550e8400_thumb.jpg
         """
-        path_parts = s3_key.rsplit('/', 1)
-        if len(path_parts) == 2:
-            folder, filename = path_parts
+        # rfind + 슬라이싱으로 중간 리스트 생성 없이 분리
+        slash = s3_key.rfind('/')
+        dot = s3_key.rfind('.', slash + 1)
+        folder = s3_key[:slash] if slash != -1 else ''
+        
+        if dot == -1:
+            stem, ext = s3_key[slash + 1:], ''
         else:
-            folder, filename = '', path_parts[0]
+            stem = s3_key[slash + 1:dot]
+            # 점으로 끝나는 파일명은 확장자 없음으로 처리
+            ext = s3_key[dot:] if dot < len(s3_key) - 1 else ''
         
-        name, ext = filename.rsplit('.', 1) if '.' in filename else (filename, '')
-        thumbnail_filename = f"{name}_thumb.{ext}" if ext else f"{name}_thumb"
+        return f"{folder}/thumbs/{stem}_thumb{ext}"
+
+    def _get_signing_credentials(self) -> Optional[Tuple[Any, str, str, Dict[str, bytes]]]:
+        """
+        서명용 자격 증명 조회 (자격 증명이 바뀔 때만 인코딩 값/서명 키 캐시 재생성)
+        - 고정 스냅샷은 매번 새로 조회: boto3 클라이언트가 같은 RefreshableCredentials 를 먼저 갱신하면
+          refresh_needed() 가 다시 False 가 되므로 그것만으로는 교체 시점을 알 수 없음
         
-        return f"{folder}/thumbs/{thumbnail_filename}"
+        Returns:
+            (고정 자격 증명, 인코딩된 Access Key, 인코딩된 세션 토큰 파라미터, 일별 서명 키 캐시) 또는 None
+        """
+        credentials = _boto_session.get_credentials()
+        if credentials is None:
+            return None
+        
+        creds = credentials.get_frozen_credentials()
+        cached = self._signing_creds
+        if (
+            cached is None
+            or cached[0].access_key != creds.access_key
+            or cached[0].token != creds.token
+        ):
+            # IRSA 임시 자격 증명은 세션 토큰 포함 필수
+            token_param = f"&X-Amz-Security-Token={_uri_encode(creds.token)}" if creds.token else ""
+            cached = (creds, _uri_encode(creds.access_key), token_param, {})
+            self._signing_creds = cached
+        return cached
+
+    def _presign_get(self, s3_key: str, expires_in: int) -> Optional[str]:
+        """
+        GET 다운로드용 SigV4 Presigned URL 직접 생성
+        - botocore의 파라미터 검증/직렬화 과정을 거치지 않고 HMAC-SHA256으로 서명
+        - 자격 증명을 찾을 수 없으면 None 반환
+        """
+        signing_creds = self._get_signing_credentials()
+        if signing_creds is None:
+            return None
+        creds, encoded_access_key, token_param, signing_key_cache = signing_creds
+        
+        amz_date = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+        date_stamp = amz_date[:8]
+        scope = f"{date_stamp}/{self.region}/s3/aws4_request"
+        host = self._s3_host
+        canonical_uri = "/" + _uri_encode(s3_key, safe="/~")
+        
+        # 파라미터는 이미 정렬된 순서로 직접 조립 (고정 값은 미리 인코딩)
+        canonical_query = (
+            "X-Amz-Algorithm=AWS4-HMAC-SHA256"
+            f"&X-Amz-Credential={encoded_access_key}%2F{date_stamp}%2F{self._encoded_region}%2Fs3%2Faws4_request"
+            f"&X-Amz-Date={amz_date}"
+            f"&X-Amz-Expires={expires_in}"
+            f"{token_param}"
+            f"&X-Amz-SignedHeaders=host"
+            f"{_RESPONSE_CACHE_CONTROL_PARAM}"
+        )
+        
+        canonical_request = f"GET\n{canonical_uri}\n{canonical_query}\nhost:{host}\n\nhost\nUNSIGNED-PAYLOAD"
+        string_to_sign = (
+            f"AWS4-HMAC-SHA256\n{amz_date}\n{scope}\n"
+            f"{hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()}"
+        )
+        # 서명 키는 UTC 날짜가 바뀔 때만 다시 계산 (HMAC 4단계 생략)
+        signing_key = signing_key_cache.get(date_stamp)
+        if signing_key is None:
+            signing_key = _derive_signing_key(creds.secret_key, date_stamp, self.region)
+            signing_key_cache.clear()
+            signing_key_cache[date_stamp] = signing_key
+        signature = hmac.new(signing_key, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+        
+        return f"https://{host}{canonical_uri}?{canonical_query}&X-Amz-Signature={signature}"
+
+    def _sign_download_url(self, s3_key: str, expires_in: int) -> str:
+        """다운로드 URL 서명 (직접 서명 실패 시 boto3로 대체)"""
+        url = self._presign_get(s3_key, expires_in)
+        if url:
+            return url
+        return self.s3_client.generate_presigned_url(
+            'get_object',
+            Params={
+                'Bucket': self.bucket_name,
+                'Key': s3_key,
+                'ResponseCacheControl': 'max-age=3600'
+            },
+            ExpiresIn=expires_in,
+            HttpMethod='GET'
+        )
 
     async def generate_presigned_upload_url(
         self,
@@ -130,7 +384,8 @@ class S3Service:
                 }
             
             # Presigned POST URL 생성 (더 안전함)
-            response = self.s3_client.generate_presigned_post(
+            response = await _run_blocking(
+                self.s3_client.generate_presigned_post,
                 Bucket=self.bucket_name,
                 Key=s3_key,
                 Fields={
@@ -184,88 +439,208 @@ class S3Service:
                 # 개발 환경에서 더미 URL 반환
                 return f"https://{self.bucket_name}.s3.amazonaws.com/{s3_key}?mock=true"
             
-            # Redis 캐시 확인
-            cache_key = f"presigned:{s3_key}"
-            if redis_client:
-                try:
-                    cached_url = redis_client.get(cache_key)
+            # 로컬 캐시 확인
+            local_key = (s3_key, expires_in)
+            cached_url = _local_url_get(s3_key, expires_in)
+            if cached_url:
+                return cached_url
+            
+            # 같은 키에 대한 동시 요청은 하나만 Redis 조회/서명 수행
+            lock = self._url_locks.setdefault(local_key, asyncio.Lock())
+            try:
+                async with lock:
+                    # 대기 중 다른 요청이 채운 로컬 캐시는 여기서 바로 반환됨
+                    cached_url = _local_url_get(s3_key, expires_in)
                     if cached_url:
-                        logger.debug(f"캐시 히트: {s3_key}")
                         return cached_url
-                except Exception as e:
-                    logger.warning(f"Redis 조회 실패: {e}")
-            
-            # Presigned URL 생성 (IRSA 세션 토큰 자동 포함)
-            url = self.s3_client.generate_presigned_url(
-                'get_object',
-                Params={
-                    'Bucket': self.bucket_name,
-                    'Key': s3_key,
-                    'ResponseCacheControl': 'max-age=3600'
-                },
-                ExpiresIn=expires_in,
-                HttpMethod='GET'
-            )
-            
-            # Redis에 캐시 저장 (TTL: 50분)
-            if redis_client:
-                try:
-                    redis_client.setex(cache_key, settings.REDIS_TTL, url)
-                    logger.debug(f"캐시 저장: {s3_key}")
-                except Exception as e:
-                    logger.warning(f"Redis 저장 실패: {e}")
-            
-            return url
+                    
+                    # Redis 조회/서명은 전용 스레드 풀에서 수행
+                    return await asyncio.get_running_loop().run_in_executor(
+                        _SIGN_POOL, self._get_or_sign_download_url, s3_key, expires_in
+                    )
+            finally:
+                if not lock.locked():
+                    self._url_locks.pop(local_key, None)
             
         except ClientError as e:
             logger.error(f"S3 다운로드 URL 생성 실패: {e}")
             raise Exception(f"다운로드 URL 생성 실패: {str(e)}")
 
+    def _get_or_sign_download_url(self, s3_key: str, expires_in: int) -> str:
+        """
+        로컬 캐시 → Redis 캐시 순으로 조회 후 없으면 다운로드 URL 서명 및 캐시 저장
+        
+        Args:
+            s3_key: S3 파일 키
+            expires_in: URL 만료 시간 (초)
+            
+        Returns:
+            다운로드 URL
+        """
+        # 로컬 캐시 확인 (Redis 왕복 없음)
+        cached_url = _local_url_get(s3_key, expires_in)
+        if cached_url:
+            return cached_url
+        
+        # Redis 캐시 확인 (대기 중인 SETEX와 같은 파이프라인으로 1회 왕복)
+        cache_key = f"presigned:{s3_key}"
+        if redis_client:
+            try:
+                with redis_client.pipeline(transaction=False) as pipe:
+                    self._queue_pending_url_writes(pipe)
+                    pipe.get(cache_key)
+                    cached_url = pipe.execute()[-1]
+                if cached_url:
+                    logger.debug(f"캐시 히트: {s3_key}")
+                    _local_url_put(s3_key, expires_in, cached_url)
+                    return cached_url
+            except Exception as e:
+                logger.warning(f"Redis 조회 실패: {e}")
+        
+        # Presigned URL 생성 (IRSA 세션 토큰 자동 포함)
+        url = self._sign_download_url(s3_key, expires_in)
+        
+        # Redis 캐시 저장은 다음 조회 파이프라인에 실어 보냄 (TTL: 서명 만료보다 짧게)
+        # 전송이 늦어져도 서명 시점 기준 만료를 넘지 않도록 절대 만료 시각으로 보관
+        ttl = _url_cache_ttl(expires_in)
+        if redis_client and ttl > 0:
+            with self._pending_url_writes_lock:
+                self._pending_url_writes.append((cache_key, time.monotonic() + ttl, url))
+                buffer_full = len(self._pending_url_writes) >= PENDING_URL_WRITE_LIMIT
+            if buffer_full:
+                self.flush_pending_url_writes()
+        
+        _local_url_put(s3_key, expires_in, url)
+        return url
+
+    def _queue_pending_url_writes(self, pipe) -> None:
+        """대기 중인 URL 캐시 SETEX를 파이프라인에 추가 (남은 TTL로 저장, 이미 만료된 항목은 버림)"""
+        with self._pending_url_writes_lock:
+            writes, self._pending_url_writes = self._pending_url_writes, []
+        now = time.monotonic()
+        for cache_key, deadline, url in writes:
+            ttl = int(deadline - now)
+            if ttl > 0:
+                pipe.setex(cache_key, ttl, url)
+
+    def flush_pending_url_writes(self) -> None:
+        """대기 중인 URL 캐시 SETEX를 Redis에 즉시 전송"""
+        if not redis_client or not self._pending_url_writes:
+            return
+        try:
+            with redis_client.pipeline(transaction=False) as pipe:
+                self._queue_pending_url_writes(pipe)
+                pipe.execute()
+        except Exception as e:
+            logger.warning(f"Redis 저장 실패: {e}")
+
     def generate_presigned_url_sync(self, s3_key: str, expires_in: int = 3600) -> str:
         """
-        파일 다운로드용 Presigned URL 생성 (동기 버전, Redis 캐싱 적용)
+        파일 다운로드용 Presigned URL 생성 (동기 버전, 로컬 + Redis 캐싱 적용)
         - 모델 property에서 사용
         """
         try:
             if not self.s3_client:
                 return f"https://{self.bucket_name}.s3.amazonaws.com/{s3_key}?mock=true"
             
-            # Redis 캐시 확인
-            cache_key = f"presigned:{s3_key}"
-            if redis_client:
-                try:
-                    cached_url = redis_client.get(cache_key)
-                    if cached_url:
-                        logger.debug(f"캐시 히트 (sync): {s3_key}")
-                        return cached_url
-                except Exception as e:
-                    logger.warning(f"Redis 조회 실패: {e}")
-            
-            url = self.s3_client.generate_presigned_url(
-                'get_object',
-                Params={
-                    'Bucket': self.bucket_name,
-                    'Key': s3_key,
-                    'ResponseCacheControl': 'max-age=3600'
-                },
-                ExpiresIn=expires_in,
-                HttpMethod='GET'
-            )
-            
-            # Redis에 캐시 저장 (TTL: 50분)
-            if redis_client:
-                try:
-                    redis_client.setex(cache_key, settings.REDIS_TTL, url)
-                    logger.debug(f"캐시 저장 (sync): {s3_key}")
-                except Exception as e:
-                    logger.warning(f"Redis 저장 실패: {e}")
-            
-            return url
+            return self._get_or_sign_download_url(s3_key, expires_in)
         except ClientError as e:
             logger.error(f"S3 Presigned URL 생성 실패: {e}")
             from app.core.config import settings
             return f"{settings.BACKEND_BASE_URL}/library/library-items/file/{s3_key}"
 
+    def generate_presigned_urls_batch(
+        self,
+        s3_keys: List[str],
+        expires_in: int = 3600
+    ) -> Dict[str, str]:
+        """
+        여러 파일의 다운로드용 Presigned URL 일괄 생성
+        - 로컬 캐시 → Redis MGET 한 번 → 미스만 서명 → 파이프라인 SETEX 한 번
+        
+        Args:
+            s3_keys: S3 파일 키 목록
+            expires_in: URL 만료 시간 (초)
+            
+        Returns:
+            {s3_key: 다운로드 URL} 딕셔너리
+        """
+        keys = list(dict.fromkeys(k for k in s3_keys if k))
+        if not keys:
+            return {}
+        
+        if not self.s3_client:
+            return {k: f"https://{self.bucket_name}.s3.amazonaws.com/{k}?mock=true" for k in keys}
+        
+        urls: Dict[str, str] = {}
+        
+        # 로컬 캐시 확인
+        pending = []
+        for key in keys:
+            cached_url = _local_url_get(key, expires_in)
+            if cached_url:
+                urls[key] = cached_url
+            else:
+                pending.append(key)
+        
+        # Redis 캐시 일괄 조회 (1회 왕복)
+        if pending and redis_client:
+            try:
+                cached_urls = redis_client.mget([f"presigned:{k}" for k in pending])
+                misses = []
+                for key, cached_url in zip(pending, cached_urls):
+                    if cached_url:
+                        urls[key] = cached_url
+                        # 단일 키 경로와 동일하게 Redis 히트도 로컬 캐시에 저장
+                        _local_url_put(key, expires_in, cached_url)
+                    else:
+                        misses.append(key)
+                pending = misses
+            except Exception as e:
+                logger.warning(f"Redis 일괄 조회 실패: {e}")
+        
+        # 캐시 미스만 서명 (로컬 HMAC 서명이라 키당 수 마이크로초)
+        fresh = {key: self._sign_download_url(key, expires_in) for key in pending}
+        urls.update(fresh)
+        
+        # Redis에 일괄 저장 (대기 중인 SETEX 포함, 파이프라인 1회 왕복)
+        ttl = _url_cache_ttl(expires_in)
+        if fresh and redis_client and ttl > 0:
+            try:
+                with redis_client.pipeline(transaction=False) as pipe:
+                    self._queue_pending_url_writes(pipe)
+                    for key, url in fresh.items():
+                        pipe.setex(f"presigned:{key}", ttl, url)
+                    pipe.execute()
+            except Exception as e:
+                logger.warning(f"Redis 일괄 저장 실패: {e}")
+        
+        for key in pending:
+            _local_url_put(key, expires_in, urls[key])
+        
+        logger.debug(f"Presigned URL 일괄 생성: {len(keys)}개 (서명 {len(fresh)}개)")
+        return urls
+    
+    async def generate_presigned_urls_batch_async(
+        self,
+        s3_keys: List[str],
+        expires_in: int = 3600
+    ) -> Dict[str, str]:
+        """
+        여러 파일의 다운로드용 Presigned URL 일괄 생성 (비동기)
+        - Redis MGET/SETEX 가 이벤트 루프를 막지 않도록 서명 전용 스레드 풀에서 실행
+        
+        Args:
+            s3_keys: S3 파일 키 목록
+            expires_in: URL 만료 시간 (초)
+            
+        Returns:
+            {s3_key: 다운로드 URL} 딕셔너리
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            _SIGN_POOL, self.generate_presigned_urls_batch, s3_keys, expires_in
+        )
+
     async def delete_file(self, s3_key: str) -> bool:
         """
         S3에서 파일 삭제
@@ -281,7 +656,8 @@ class S3Service:
                 logger.info(f"개발 모드: 파일 삭제 시뮬레이션 - {s3_key}")
                 return True
             
-            self.s3_client.delete_object(Bucket=self.bucket_name, Key=s3_key)
+            await _run_blocking(self.s3_client.delete_object, Bucket=self.bucket_name, Key=s3_key)
+            self._invalidate_head_cache(s3_key)
             logger.info(f"S3 파일 삭제 완료: {s3_key}")
             return True
             
@@ -289,6 +665,52 @@ class S3Service:
             logger.error(f"S3 파일 삭제 실패: {e}")
             return False
 
+    async def delete_files(self, s3_keys: List[str]) -> bool:
+        """
+        S3에서 여러 파일을 일괄 삭제 (delete_objects, 요청당 최대 1000개)
+        
+        Args:
+            s3_keys: 삭제할 파일들의 S3 키 목록
+            
+        Returns:
+            전체 삭제 성공 여부
+        """
+        # 중복 키 제거 (순서 유지)
+        keys = list(dict.fromkeys(k for k in s3_keys if k))
+        if not keys:
+            return True
+        
+        if not self.s3_client:
+            logger.info(f"개발 모드: 파일 일괄 삭제 시뮬레이션 - {len(keys)}개")
+            return True
+        
+        success = True
+        for i in range(0, len(keys), DELETE_BATCH_SIZE):
+            chunk = keys[i:i + DELETE_BATCH_SIZE]
+            try:
+                response = await _run_blocking(
+                    self.s3_client.delete_objects,
+                    Bucket=self.bucket_name,
+                    Delete={
+                        'Objects': [{'Key': k} for k in chunk],
+                        'Quiet': True
+                    }
+                )
+            except ClientError as e:
+                logger.error(f"S3 파일 일괄 삭제 실패: {e}")
+                success = False
+                continue
+            
+            errors = response.get('Errors', [])
+            for error in errors:
+                logger.error(f"S3 파일 삭제 실패: {error.get('Key')} - {error.get('Message')}")
+            if errors:
+                success = False
+            logger.info(f"S3 파일 일괄 삭제 완료: {len(chunk) - len(errors)}/{len(chunk)}개")
+        
+        self._invalidate_head_cache(*keys)
+        return success
+
     async def copy_file(self, source_key: str, dest_key: str) -> bool:
         """
         S3 내에서 파일 복사
@@ -306,12 +728,14 @@ class S3Service:
                 return True
             
             copy_source = {'Bucket': self.bucket_name, 'Key': source_key}
-            self.s3_client.copy_object(
+            await _run_blocking(
+                self.s3_client.copy_object,
                 CopySource=copy_source,
                 Bucket=self.bucket_name,
                 Key=dest_key
             )
             
+            self._invalidate_head_cache(dest_key)
             logger.info(f"S3 파일 복사 완료: {source_key} -> {dest_key}")
             return True
             
@@ -339,20 +763,62 @@ class S3Service:
                     "is_mock": True
                 }
             
-            response = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+            cached_info = self._get_cached_head(s3_key)
+            if cached_info is not None:
+                return cached_info
             
-            return {
-                "size": response.get("ContentLength", 0),
-                "last_modified": response.get("LastModified"),
-                "content_type": response.get("ContentType", "application/octet-stream"),
-                "metadata": response.get("Metadata", {}),
-                "is_mock": False
-            }
+            return self._head_and_cache(s3_key)
             
         except ClientError as e:
             logger.error(f"S3 파일 정보 조회 실패: {e}")
             return None
 
+    def _head_and_cache(self, s3_key: str) -> Dict[str, Any]:
+        """head_object 호출 후 결과를 Redis에 캐시 (없는 파일이면 ClientError 발생)"""
+        response = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+        
+        file_info = {
+            "size": response.get("ContentLength", 0),
+            "last_modified": response.get("LastModified"),
+            "content_type": response.get("ContentType", "application/octet-stream"),
+            "metadata": response.get("Metadata", {}),
+            "is_mock": False
+        }
+        
+        if redis_client:
+            try:
+                redis_client.setex(f"head:{s3_key}", HEAD_CACHE_TTL, orjson.dumps(file_info))
+            except Exception as e:
+                logger.warning(f"Redis 저장 실패: {e}")
+        
+        return file_info
+
+    def _get_cached_head(self, s3_key: str) -> Optional[Dict[str, Any]]:
+        """Redis에 캐시된 head_object 결과 조회"""
+        if not redis_client:
+            return None
+        try:
+            cached = redis_client.get(f"head:{s3_key}")
+        except Exception as e:
+            logger.warning(f"Redis 조회 실패: {e}")
+            return None
+        if not cached:
+            return None
+        
+        file_info = orjson.loads(cached)
+        if file_info.get("last_modified"):
+            file_info["last_modified"] = datetime.fromisoformat(file_info["last_modified"])
+        return file_info
+
+    def _invalidate_head_cache(self, *s3_keys: str) -> None:
+        """업로드/삭제/복사된 키의 head_object 캐시 무효화"""
+        if not redis_client or not s3_keys:
+            return
+        try:
+            redis_client.delete(*(f"head:{k}" for k in s3_keys))
+        except Exception as e:
+            logger.warning(f"Redis 캐시 무효화 실패: {e}")
+
     def file_exists(self, s3_key: str) -> bool:
         """
         S3 파일 존재 여부 확인
@@ -363,14 +829,21 @@ class S3Service:
         Returns:
             파일 존재 여부 (True/False)
         """
+        if not self.s3_client:
+            # 개발 환경에서는 항상 존재한다고 가정
+            return True
+        
+        # 캐시 히트 시 S3 호출 생략 (존재하는 파일만 캐시되므로 히트 = 존재)
+        if self._get_cached_head(s3_key) is not None:
+            return True
+        
+        return self._head_exists(s3_key)
+
+    def _head_exists(self, s3_key: str) -> bool:
+        """head_object로 존재 여부 확인 (존재하면 결과를 Redis에 캐시)"""
         try:
-            if not self.s3_client:
-                # 개발 환경에서는 항상 존재한다고 가정
-                return True
-            
-            self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+            self._head_and_cache(s3_key)
             return True
-            
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', '')
             if error_code == '404' or error_code == 'NoSuchKey':
@@ -379,6 +852,46 @@ class S3Service:
             logger.error(f"S3 파일 존재 확인 실패: {e}")
             return False
 
+    def _cached_head_keys(self, s3_keys: List[str]) -> Set[str]:
+        """Redis MGET 한 번으로 head_object 캐시가 있는 키 집합 조회"""
+        if not redis_client:
+            return set()
+        try:
+            cached = redis_client.mget([f"head:{k}" for k in s3_keys])
+        except Exception as e:
+            logger.warning(f"Redis 일괄 조회 실패: {e}")
+            return set()
+        return {key for key, value in zip(s3_keys, cached) if value}
+
+    async def files_exist_batch(self, s3_keys: List[str]) -> Dict[str, bool]:
+        """
+        여러 S3 파일 존재 여부 일괄 확인
+        - 캐시 조회는 Redis MGET 한 번, 미스만 head_object (모두 S3 전용 스레드 풀에서 실행)
+        
+        Args:
+            s3_keys: S3 파일 키 목록
+            
+        Returns:
+            {s3_key: 존재 여부} 딕셔너리
+        """
+        keys = list(dict.fromkeys(k for k in s3_keys if k))
+        if not keys:
+            return {}
+        
+        if not self.s3_client:
+            # 개발 환경에서는 항상 존재한다고 가정
+            return dict.fromkeys(keys, True)
+        
+        # 캐시 히트 = 존재 (존재하는 파일만 캐시됨)
+        hits = await _run_blocking(self._cached_head_keys, keys)
+        results = dict.fromkeys(hits, True)
+        
+        misses = [k for k in keys if k not in hits]
+        if misses:
+            exists = await asyncio.gather(*(_run_blocking(self._head_exists, k) for k in misses))
+            results.update(zip(misses, exists))
+        return results
+
     def is_image_file(self, content_type: str) -> bool:
         """이미지 파일 여부 확인"""
         return content_type.startswith('image/')
@@ -390,16 +903,18 @@ class S3Service:
     async def upload_file_content(
         self,
         s3_key: str,
-        file_content: bytes,
+        file_content: Union[bytes, bytearray, memoryview, BinaryIO],
         content_type: str,
         metadata: Optional[Dict[str, str]] = None
     ) -> bool:
         """
         파일 내용을 S3에 직접 업로드
+        - 파일 객체: 메모리에 읽지 않고 upload_fileobj로 스트리밍 (8MB 초과 시 멀티파트)
+        - 8MB 초과 bytes: upload_fileobj 멀티파트 업로드 (청크 병렬 전송)
         
         Args:
             s3_key: S3 파일 키
-            file_content: 업로드할 파일 내용 (bytes)
+            file_content: 업로드할 파일 내용 (bytes, bytearray, memoryview) 또는 바이너리 파일 객체
             content_type: 파일 MIME 타입
             metadata: 추가 메타데이터
             
@@ -411,20 +926,44 @@ class S3Service:
                 logger.info(f"개발 모드: S3 업로드 시뮬레이션 - {s3_key}")
                 return True
             
-            # S3에 파일 업로드
-            put_object_kwargs = {
-                'Bucket': self.bucket_name,
-                'Key': s3_key,
-                'Body': file_content,
-                'ContentType': content_type
-            }
+            # 파일 객체: 전송 매니저로 스트리밍 (크기에 따라 단일 PUT/멀티파트 자동 선택)
+            if hasattr(file_content, 'read'):
+                await self._upload_fileobj(file_content, s3_key, content_type, metadata)
+                logger.info("S3 스트리밍 업로드 성공: %s", s3_key)
+                return True
             
-            # 메타데이터 추가 (있는 경우)
-            if metadata:
-                put_object_kwargs['Metadata'] = metadata
+            content_size = file_content.nbytes if isinstance(file_content, memoryview) else len(file_content)
+            
+            # 대용량 파일: 멀티파트 업로드 (boto3 전송 매니저 사용)
+            if content_size > MULTIPART_THRESHOLD:
+                await self._upload_fileobj(io.BytesIO(file_content), s3_key, content_type, metadata)
+                logger.info("S3 멀티파트 업로드 성공: %s (%d bytes)", s3_key, content_size)
+                return True
             
-            self.s3_client.put_object(**put_object_kwargs)
-            logger.info(f"S3 파일 업로드 성공: {s3_key} ({len(file_content)} bytes)")
+            # put_object Body는 bytes/bytearray/파일 객체만 허용
+            if isinstance(file_content, memoryview):
+                file_content = file_content.tobytes()
+            
+            # S3에 파일 업로드 (메타데이터 유무에 따라 분기, kwargs 딕셔너리 생성 없음)
+            if metadata:
+                await _run_blocking(
+                    self.s3_client.put_object,
+                    Bucket=self.bucket_name,
+                    Key=s3_key,
+                    Body=file_content,
+                    ContentType=content_type,
+                    Metadata=metadata
+                )
+            else:
+                await _run_blocking(
+                    self.s3_client.put_object,
+                    Bucket=self.bucket_name,
+                    Key=s3_key,
+                    Body=file_content,
+                    ContentType=content_type
+                )
+            self._invalidate_head_cache(s3_key)
+            logger.info("S3 파일 업로드 성공: %s (%d bytes)", s3_key, content_size)
             return True
             
         except ClientError as e:
@@ -434,9 +973,30 @@ class S3Service:
             logger.error(f"파일 업로드 중 예상치 못한 오류: {e}")
             return False
 
+    async def _upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        s3_key: str,
+        content_type: str,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> None:
+        """boto3 전송 매니저로 파일 객체 업로드 (8MB 청크 병렬 멀티파트, S3 전용 스레드 풀에서 실행)"""
+        extra_args = {'ContentType': content_type}
+        if metadata:
+            extra_args['Metadata'] = metadata
+        await _run_blocking(
+            self.s3_client.upload_fileobj,
+            fileobj,
+            self.bucket_name,
+            s3_key,
+            ExtraArgs=extra_args,
+            Config=_TRANSFER_CONFIG
+        )
+        self._invalidate_head_cache(s3_key)
+
     def needs_thumbnail(self, content_type: str) -> bool:
         """썸네일 생성이 필요한 파일 타입인지 확인"""
-        return self.is_image_file(content_type) or self.is_video_file(content_type)
+        return content_type.partition('/')[0] in _THUMBNAIL_MAJOR_TYPES
 
     async def trigger_video_preview_generation(
         self,
@@ -454,12 +1014,6 @@ class S3Service:
             Step Functions 실행 ARN 또는 None
         """
         try:
-            # Step Functions 클라이언트 생성
-            sfn_client = boto3.client(
-                'stepfunctions',
-                region_name=self.region
-            )
-            
             # Step Functions State Machine ARN
             state_machine_arn = settings.VIDEO_PREVIEW_STATE_MACHINE_ARN
             
@@ -474,10 +1028,16 @@ class S3Service:
                 "item_id": item_id
             }
             
+            sfn_client = self.sfn_client
+            if sfn_client is None:
+                logger.warning("Step Functions 클라이언트 없음 - 프리뷰 생성 건너뜀")
+                return None
+            
             # Step Functions 실행
-            response = sfn_client.start_execution(
+            response = await _run_blocking(
+                sfn_client.start_execution,
                 stateMachineArn=state_machine_arn,
-                input=json.dumps(input_data)
+                input=orjson.dumps(input_data).decode()
             )
             
             execution_arn = response.get('executionArn')
@@ -498,12 +1058,17 @@ class S3Service:
         
         형식: previews/{원본파일명}_preview.mp4
         """
-        # 원본 파일명에서 확장자 제거
-        filename = s3_key.split('/')[-1]
-        name = filename.rsplit('.', 1)[0] if '.' in filename else filename
+        # 원본 파일명에서 확장자 제거 (rpartition: 중간 리스트 생성 없음)
+        filename = s3_key.rpartition('/')[2]
+        name, sep, _ = filename.rpartition('.')
+        if not sep:
+            name = filename
         
         return f"previews/{name}_preview.mp4"
 
 
-# 전역 S3 서비스 인스턴스
-s3_service = S3Service()
+# 전역 S3 서비스 인스턴스 (첫 사용 시 생성, 이후 재사용)
+@cache
+def get_s3_service() -> S3Service:
+    """S3 서비스 싱글톤 반환 (S3를 쓰지 않는 스크립트는 생성 비용을 치르지 않음)"""
+    return S3Service()
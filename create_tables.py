@@ -5,7 +5,7 @@ Alembic 없이 간단하게 테이블을 만들 수 있습니다.
 """
 
 import asyncio
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from app.core.config import settings
 from app.database.models_config import Base
 
@@ -20,13 +20,25 @@ def create_tables():
     # 동기 엔진 생성
     engine = create_engine(settings.database_url_sync)
     
-    # 모든 테이블 생성
-    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        # 기존 테이블 목록을 한 번만 조회 (create_all의 테이블별 존재 확인 쿼리 생략)
+        existing = set(inspect(conn).get_table_names())
+        missing = [
+            table for table in Base.metadata.sorted_tables
+            if table.name not in existing
+        ]
+        
+        # 없는 테이블만 한 트랜잭션에서 생성
+        # checkfirst 유지: 테이블이 없어도 PG enum 타입(itemtype/visibilitytype)은 남아 있을 수 있음
+        if missing:
+            Base.metadata.create_all(bind=conn, tables=missing, checkfirst=True)
     
     print("✅ 테이블 생성 완료!")
     print("📊 생성된 테이블:")
-    for table_name in Base.metadata.tables.keys():
-        print(f"  - {table_name}")
+    for table in missing:
+        print(f"  - {table.name}")
+    for table_name in sorted(existing & set(Base.metadata.tables.keys())):
+        print(f"  - {table_name} (이미 존재)")
 
 if __name__ == "__main__":
     create_tables()
\ No newline at end of file
@@ -9,7 +9,6 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database.models_config import sync_engine
-from sqlalchemy import text
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -18,11 +17,13 @@ logger = logging.getLogger(__name__)
 def create_trigger():
     """PostgreSQL 트리거 생성"""
     try:
-        with sync_engine.connect() as conn:
+        # begin(): 블록 종료 시 자동 커밋
+        with sync_engine.begin() as conn:
             logger.info("🔄 PostgreSQL 트리거 생성 중...")
             
-            # 1. 트리거 함수 생성 (친구가 성공한 코드 그대로 사용)
-            function_sql = """
+            # 함수 생성 → 기존 트리거 삭제 → 새 트리거 생성을 한 번의 요청으로 실행
+            # (친구가 성공한 코드 그대로 사용)
+            ddl = """
             CREATE OR REPLACE FUNCTION update_history_s3_key_on_library_delete()
             RETURNS TRIGGER AS $$
             BEGIN
@@ -34,39 +35,25 @@ def create_trigger():
                 RETURN OLD;
             END;
             $$ LANGUAGE plpgsql;
-            """
-            
-            conn.execute(text(function_sql))
-            logger.info("✅ 트리거 함수 생성 완료")
             
-            # 2. 기존 트리거 삭제 (있다면)
-            drop_trigger_sql = """
             DROP TRIGGER IF EXISTS trigger_update_history_on_library_delete ON library_items;
-            """
-            
-            conn.execute(text(drop_trigger_sql))
-            logger.info("🗑️ 기존 트리거 삭제 완료")
             
-            # 3. 새 트리거 생성 (친구가 성공한 코드 그대로 사용)
-            trigger_sql = """
             CREATE TRIGGER trigger_update_history_on_library_delete
                 AFTER DELETE ON library_items
                 FOR EACH ROW
                 EXECUTE FUNCTION update_history_s3_key_on_library_delete();
             """
             
-            conn.execute(text(trigger_sql))
-            logger.info("✅ 트리거 생성 완료")
-            
-            # 4. 변경사항 커밋
-            conn.commit()
-            logger.info("💾 변경사항 저장 완료")
-            
-            print("\n🎉 트리거 생성 성공!")
-            print("📋 생성된 트리거:")
-            print("  - 함수명: update_history_s3_key_on_library_delete()")
-            print("  - 트리거명: trigger_update_history_on_library_delete")
-            print("  - 동작: library_items 삭제 시 history 테이블의 s3_key를 NULL로 설정")
+            conn.exec_driver_sql(ddl)
+            logger.info("✅ 트리거 함수/트리거 생성 완료")
+        
+        logger.info("💾 변경사항 저장 완료")
+        
+        print("\n🎉 트리거 생성 성공!")
+        print("📋 생성된 트리거:")
+        print("  - 함수명: update_history_s3_key_on_library_delete()")
+        print("  - 트리거명: trigger_update_history_on_library_delete")
+        print("  - 동작: library_items 삭제 시 history 테이블의 s3_key를 NULL로 설정")
             
     except Exception as e:
         logger.error(f"❌ 트리거 생성 실패: {e}")
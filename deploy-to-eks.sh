@@ -61,20 +61,31 @@ docker push $AWS_ACCOUNT_ID.dkr.ecr.$AWS_REGION.amazonaws.com/$ECR_REPOSITORY:$I
 echo -e "${YELLOW}6. EKS 클러스터 연결...${NC}"
 aws eks update-kubeconfig --region $AWS_REGION --name $EKS_CLUSTER_NAME
 
-# 7. Kubernetes 배포
-echo -e "${YELLOW}7. Kubernetes에 배포...${NC}"
+# 7. 테이블 생성 Job 실행 (누락된 테이블만 생성, 완료 후 배포 진행)
+echo -e "${YELLOW}7. 테이블 생성 Job 실행...${NC}"
+# Job이 사용하는 ServiceAccount(IRSA)는 k8s-deployment.yaml 에 정의되어 있으므로 최초 배포 시 먼저 생성
+# (app 레이블이 없는 리소스 = ServiceAccount 만 적용)
+if ! kubectl get serviceaccount library-service-account -n default &> /dev/null; then
+    kubectl apply -f k8s-deployment.yaml -l '!app'
+fi
+kubectl delete job library-backend-create-tables -n default --ignore-not-found
+kubectl apply -f k8s-create-tables-job.yaml
+kubectl wait --for=condition=complete job/library-backend-create-tables -n default --timeout=300s
+
+# 8. Kubernetes 배포
+echo -e "${YELLOW}8. Kubernetes에 배포...${NC}"
 kubectl apply -f k8s-deployment.yaml
 
-# 8. 배포 상태 확인
-echo -e "${YELLOW}8. 배포 상태 확인...${NC}"
+# 9. 배포 상태 확인
+echo -e "${YELLOW}9. 배포 상태 확인...${NC}"
 kubectl rollout status deployment/library-backend -n default
 
-# 9. Pod 상태 확인
-echo -e "${YELLOW}9. Pod 상태 확인...${NC}"
+# 10. Pod 상태 확인
+echo -e "${YELLOW}10. Pod 상태 확인...${NC}"
 kubectl get pods -l app=library-backend -n default
 
-# 10. 서비스 확인
-echo -e "${YELLOW}10. 서비스 확인...${NC}"
+# 11. 서비스 확인
+echo -e "${YELLOW}11. 서비스 확인...${NC}"
 kubectl get service library-backend-service -n default
 
 echo -e "${GREEN}=== 배포 완료! ===${NC}"
@@ -43,11 +43,18 @@ try:
     print()
     
     if __name__ == "__main__":
+        workers = settings.worker_count
+        print(f"👷 워커 수: {workers}")
+        
         uvicorn.run(
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.DEBUG,
+        workers=workers,
+        # uvloop(libuv 이벤트 루프) + httptools(C HTTP 파서), uvicorn[standard]에 포함 (Windows는 uvloop 미지원)
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         log_level="info" if settings.DEBUG else "warning",
         access_log=settings.DEBUG
         )
@@ -1,6 +1,6 @@
 import asyncio
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Dict, Any
 
@@ -127,21 +127,25 @@ async def seed() -> None:
         user = await user_crud.get_by_username(session, username="test_user")
         if not user:
             user = await user_crud.create_user(
-                session, user_in=UserCreate(username="test_user", nickname="test_user")
+                session, user_in=UserCreate(user_id="test_user", nickname="test_user")
             )
 
-        for item in SEED_ITEMS:
-            exists = await session.execute(
-                select(LibraryItem).where(
-                    LibraryItem.user_profile_id == user.id,
-                    LibraryItem.name == item["name"],
-                )
+        # Fetch already-seeded names in one round trip instead of one SELECT per item.
+        names = [item["name"] for item in SEED_ITEMS]
+        result = await session.execute(
+            select(LibraryItem.name).where(
+                LibraryItem.user_id == user.user_id,
+                LibraryItem.name.in_(names),
             )
-            if exists.scalar_one_or_none():
-                continue
+        )
+        existing = set(result.scalars().all())
 
-            db_item = LibraryItem(
-                user_profile_id=user.id,
+        # One timestamp for the whole batch so created_at/updated_at match across rows.
+        now = datetime.now(timezone.utc)
+
+        new_items = [
+            LibraryItem(
+                user_id=user.user_id,
                 name=item["name"],
                 type=item["type"],
                 mime_type=item["mime_type"],
@@ -151,10 +155,13 @@ async def seed() -> None:
                 file_size=item["file_size"],
                 original_filename=item["original_filename"],
                 preview_text=item.get("preview_text"),
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+                created_at=now,
+                updated_at=now,
             )
-            session.add(db_item)
+            for item in SEED_ITEMS
+            if item["name"] not in existing
+        ]
+        session.add_all(new_items)
 
         await session.commit()
 
@@ -8,48 +8,131 @@
 - 데이터베이스 연결 테스트 (선택사항)
 """
 
+import asyncio
+import importlib
+import io
+import os
 import sys
-from pathlib import Path
+import threading
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가 (스크립트 직접 실행 시 이미 sys.path[0] 이므로 중복 추가 안 함)
+project_root = os.path.dirname(os.path.abspath(__file__))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# 비동기 테스트 공용 이벤트 루프 (테스트마다 루프를 새로 만들지 않고 재사용)
+# run_server.py 와 동일하게 uvloop 우선 사용, 미설치/Windows 환경은 기본 asyncio 루프
+try:
+    import uvloop
+    _LOOP = uvloop.new_event_loop()
+except ImportError:
+    _LOOP = asyncio.new_event_loop()
+
+# 상태 표시 기호: 터미널이면 이모지, 파이프/CI 로그 등 비대화형 출력이면 ASCII
+_OK, _FAIL, _WARN = ("✅", "❌", "⚠️") if sys.stdout.isatty() else ("[OK]", "[FAIL]", "[WARN]")
+
+# --full 지정 시에만 라우터/CRUD/FastAPI 앱까지 실제로 import
+_FULL = "--full" in sys.argv
+
+# import 테스트 대상: (표시 이름, 모듈 목록, 기본 실행에서도 실제 로드할지 여부)
+# 로드하지 않는 항목은 소스 파일 존재 여부만 확인
+# (find_spec 은 상위 패키지를 import 하므로 app/crud/__init__.py 처럼 하위 모듈을 모두 로드하는 패키지에서는 의미 없음)
+_IMPORT_PROBES = (
+    ("설정", ("app.core.config",), True),
+    ("모델", ("app.models.user", "app.models.library_item"), True),
+    ("스키마", ("app.schemas.user", "app.schemas.library_item"), True),
+    ("CRUD", ("app.crud.user", "app.crud.library_item"), False),
+    ("API 라우터", ("app.api.v1.users", "app.api.v1.library_items"), False),
+)
+
+# cached_import 로 한 번 꺼낸 심볼 캐시: (모듈명, 이름) -> 객체
+_SYMS = {}
+
+
+def cached_import(module_name, item_name):
+    """
+    모듈에서 심볼을 꺼내 캐시 (테스트마다 from-import 를 반복하지 않도록)
+    
+    Args:
+        module_name: 모듈 경로 (예: "app.models.user")
+        item_name: 꺼낼 속성 이름 (예: "User")
+        
+    Returns:
+        모듈 속성 객체
+    """
+    key = (module_name, item_name)
+    try:
+        return _SYMS[key]
+    except KeyError:
+        # sys.modules 를 직접 보지 않고 import_module 사용 (다른 스레드가 import 중이면 import lock 으로 완료까지 대기)
+        module = importlib.import_module(module_name)
+        obj = _SYMS[key] = getattr(module, item_name)
+        return obj
+
+
+def _construct_model(model, data):
+    """
+    __init__ 을 거치지 않고 SQLAlchemy 모델 인스턴스 생성 (repr 확인용)
+    
+    Args:
+        model: SQLAlchemy 선언적 모델 클래스
+        data: 컬럼명 -> 값 딕셔너리
+        
+    Returns:
+        값이 채워진 transient 인스턴스
+    """
+    # 매퍼 구성 전에는 InstrumentedAttribute.impl 이 None 이라 속성 조회(__repr__)가 실패하므로 먼저 구성
+    cached_import("sqlalchemy.orm", "configure_mappers")()
+    sa_inspect = cached_import("sqlalchemy", "inspect")
+    instance = sa_inspect(model).class_manager.new_instance()
+    instance.__dict__.update(data)
+    return instance
+
+
+def _module_file_exists(module_name):
+    """
+    모듈 소스 파일 존재 여부 확인 (상위 패키지를 import 하지 않음)
+    
+    Args:
+        module_name: 모듈 경로 (예: "app.crud.user")
+        
+    Returns:
+        모듈 파일(.py) 또는 패키지(__init__.py) 존재 여부
+    """
+    base = os.path.join(project_root, *module_name.split("."))
+    return os.path.isfile(base + ".py") or os.path.isfile(os.path.join(base, "__init__.py"))
 
-# 프로젝트 루트를 Python 경로에 추가
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
 
 def test_imports():
     """모듈 import 테스트"""
     print("🔍 모듈 import 테스트...")
     
     try:
-        # 핵심 모듈들 import 테스트
-        from app.core.config import settings
-        print("✅ 설정 모듈 import 성공")
+        for label, modules, load in _IMPORT_PROBES:
+            for module_name in modules:
+                if load or _FULL:
+                    importlib.import_module(module_name)
+                elif not _module_file_exists(module_name):
+                    raise ImportError(f"모듈을 찾을 수 없습니다: {module_name}")
+            print(f"{_OK} {label} 모듈 import 성공" if load or _FULL else f"{_OK} {label} 모듈 파일 확인 (import 생략)")
         
-        from app.models.user import User
-        from app.models.library_item import LibraryItem
-        print("✅ 모델 모듈 import 성공")
-        
-        from app.schemas.user import UserCreate, UserResponse
-        from app.schemas.library_item import LibraryItemCreate, LibraryItemResponse
-        print("✅ 스키마 모듈 import 성공")
-        
-        from app.crud.user import user_crud
-        from app.crud.library_item import library_item_crud
-        print("✅ CRUD 모듈 import 성공")
-        
-        from app.api.v1.users import router as users_router
-        from app.api.v1.library_items import router as items_router
-        print("✅ API 라우터 import 성공")
-        
-        from app.main import app
-        print("✅ FastAPI 앱 import 성공")
+        if _FULL:
+            importlib.import_module("app.main")
+            print(f"{_OK} FastAPI 앱 import 성공")
+        else:
+            print("💡 FastAPI 앱 import 는 --full 옵션으로 실행하세요")
         
         return True
         
     except ImportError as e:
-        print(f"❌ Import 오류: {e}")
+        print(f"{_FAIL} Import 오류: {e}")
         return False
     except Exception as e:
-        print(f"❌ 예상치 못한 오류: {e}")
+        print(f"{_FAIL} 예상치 못한 오류: {e}")
         return False
 
 
@@ -58,47 +141,45 @@ def test_config():
     print("\n🔧 설정 테스트...")
     
     try:
-        from app.core.config import settings
+        settings = cached_import("app.core.config", "settings")
+        
+        # 필드 값은 인스턴스 __dict__ 에 그대로 있으므로 딕셔너리 조회로 읽음 (복사/직렬화 없음)
+        d = settings.__dict__
         
-        print(f"📊 프로젝트명: {settings.PROJECT_NAME}")
-        print(f"🔢 버전: {settings.VERSION}")
-        print(f"🌐 호스트: {settings.HOST}:{settings.PORT}")
-        print(f"🔐 디버그 모드: {settings.DEBUG}")
-        print(f"🗄️ 데이터베이스 호스트: {settings.DB_HOST}:{settings.DB_PORT}")
-        print(f"📝 데이터베이스명: {settings.DB_NAME}")
-        print(f"🔑 JWT 알고리즘: {settings.JWT_ALGORITHM}")
-        print(f"☁️ AWS 리전: {settings.AWS_REGION}")
+        print(f"📊 프로젝트명: {d['PROJECT_NAME']}")
+        print(f"🔢 버전: {d['VERSION']}")
+        print(f"🌐 호스트: {d['HOST']}:{d['PORT']}")
+        print(f"🔐 디버그 모드: {d['DEBUG']}")
+        print(f"🗄️ 데이터베이스 호스트: {d['DB_HOST']}:{d['DB_PORT']}")
+        print(f"📝 데이터베이스명: {d['DB_NAME']}")
+        print(f"🔑 JWT 알고리즘: {d['JWT_ALGORITHM']}")
+        print(f"☁️ AWS 리전: {d['AWS_REGION']}")
         
         return True
         
     except Exception as e:
-        print(f"❌ 설정 로드 오류: {e}")
+        print(f"{_FAIL} 설정 로드 오류: {e}")
         return False
 
 
-def test_database_connection():
+async def test_database_connection():
     """데이터베이스 연결 테스트 (선택사항)"""
     print("\n🗄️ 데이터베이스 연결 테스트...")
     
     try:
-        import asyncio
-        from app.database.base import test_connection
+        test_connection = cached_import("app.database.base", "test_connection")
         
-        # 비동기 함수 실행
-        async def run_test():
-            return await test_connection()
-        
-        result = asyncio.run(run_test())
+        result = await test_connection()
         
         if result:
-            print("✅ 데이터베이스 연결 성공")
+            print(f"{_OK} 데이터베이스 연결 성공")
             return True
         else:
-            print("❌ 데이터베이스 연결 실패")
+            print(f"{_FAIL} 데이터베이스 연결 실패")
             return False
             
     except Exception as e:
-        print(f"⚠️ 데이터베이스 연결 테스트 건너뜀: {e}")
+        print(f"{_WARN} 데이터베이스 연결 테스트 건너뜀: {e}")
         print("💡 .env 파일 설정 후 다시 시도하세요")
         return None
 
@@ -108,25 +189,25 @@ def test_models():
     print("\n🏗️ 모델 생성 테스트...")
     
     try:
-        from app.models.user import User
-        from app.models.library_item import LibraryItem, ItemType, VisibilityType
-        import uuid
+        User = cached_import("app.models.user", "User")
+        LibraryItem = cached_import("app.models.library_item", "LibraryItem")
+        ItemType = cached_import("app.models.library_item", "ItemType")
+        VisibilityType = cached_import("app.models.library_item", "VisibilityType")
         
         # 사용자 모델 테스트
         user_data = {
-            "id": uuid.uuid4(),
-            "username": "test-cognito-id",
+            "user_id": "test-cognito-id",
             "nickname": "테스트사용자"
         }
         
-        # 모델 인스턴스 생성 (DB 저장 없이)
-        user = User(**user_data)
-        print(f"✅ 사용자 모델 생성: {user}")
+        # 모델 인스턴스 생성 (DB 저장 없이, __init__ 생략)
+        user = _construct_model(User, user_data)
+        print(f"{_OK} 사용자 모델 생성: {user}")
         
         # 라이브러리 아이템 모델 테스트
         item_data = {
-            "id": uuid.uuid4(),
-            "user_profile_id": user.id,
+            "id": uuid.UUID(bytes=os.urandom(16), version=4),
+            "user_id": user.user_id,
             "name": "테스트 아이템",
             "type": ItemType.image,
             "mime_type": "image/jpeg",
@@ -136,13 +217,13 @@ def test_models():
             "original_filename": "test.jpg"
         }
         
-        item = LibraryItem(**item_data)
-        print(f"✅ 라이브러리 아이템 모델 생성: {item}")
+        item = _construct_model(LibraryItem, item_data)
+        print(f"{_OK} 라이브러리 아이템 모델 생성: {item}")
         
         return True
         
     except Exception as e:
-        print(f"❌ 모델 생성 오류: {e}")
+        print(f"{_FAIL} 모델 생성 오류: {e}")
         return False
 
 
@@ -151,17 +232,23 @@ def test_schemas():
     print("\n📋 스키마 검증 테스트...")
     
     try:
-        from app.schemas.user import UserCreate, UserResponse
-        from app.schemas.library_item import LibraryItemCreate, ItemType, VisibilityType
+        UserCreate = cached_import("app.schemas.user", "UserCreate")
+        LibraryItemCreate = cached_import("app.schemas.library_item", "LibraryItemCreate")
+        ItemType = cached_import("app.schemas.library_item", "ItemType")
+        VisibilityType = cached_import("app.schemas.library_item", "VisibilityType")
+        
+        # pydantic-core 검증기를 미리 꺼내 두고 직접 호출 (kwargs 패킹/__init__ 경유 생략)
+        validate_user_create = UserCreate.__pydantic_validator__.validate_python
+        validate_item_create = LibraryItemCreate.__pydantic_validator__.validate_python
         
         # 사용자 생성 스키마 테스트
         user_create_data = {
-            "username": "test-cognito-id",
+            "user_id": "test-cognito-id",
             "nickname": "테스트사용자"
         }
         
-        user_create = UserCreate(**user_create_data)
-        print(f"✅ 사용자 생성 스키마: {user_create}")
+        user_create = validate_user_create(user_create_data)
+        print(f"{_OK} 사용자 생성 스키마: {user_create}")
         
         # 라이브러리 아이템 생성 스키마 테스트
         item_create_data = {
@@ -174,73 +261,140 @@ def test_schemas():
             "original_filename": "test.jpg"
         }
         
-        item_create = LibraryItemCreate(**item_create_data)
-        print(f"✅ 라이브러리 아이템 생성 스키마: {item_create}")
+        item_create = validate_item_create(item_create_data)
+        print(f"{_OK} 라이브러리 아이템 생성 스키마: {item_create}")
         
         return True
         
     except Exception as e:
-        print(f"❌ 스키마 검증 오류: {e}")
+        print(f"{_FAIL} 스키마 검증 오류: {e}")
         return False
 
 
+# 실행할 테스트 목록: (표시 이름, 테스트 함수)
+TESTS: Tuple[Tuple[str, Callable], ...] = (
+    ("모듈 Import", test_imports),
+    ("설정 로드", test_config),
+    ("모델 생성", test_models),
+    ("스키마 검증", test_schemas),
+    ("데이터베이스 연결", test_database_connection),
+)
+
+# 테스트 결과별 요약 행 형식
+_STATUS_FORMATS = {
+    True: f"{_OK} {{}}: 통과",
+    False: f"{_FAIL} {{}}: 실패",
+    None: f"{_WARN} {{}}: 건너뜀",
+}
+
+
+# 스레드별 출력 버퍼 (병렬 실행 중 테스트 출력이 섞이지 않도록)
+_stdout_local = threading.local()
+
+
+class _ThreadLocalStdout:
+    """현재 스레드에 버퍼가 있으면 그쪽으로, 없으면 원래 stdout 으로 write 를 보내는 대리 객체"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text):
+        return getattr(_stdout_local, "buffer", self._stream).write(text)
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _run_buffered(test_func):
+    """
+    테스트 함수 출력을 스레드별 버퍼에 모아서 결과와 함께 반환
+    
+    Args:
+        test_func: 실행할 테스트 함수 (동기 또는 코루틴 함수)
+        
+    Returns:
+        (테스트 결과 True/False/None, 출력 문자열)
+    """
+    buffer = _stdout_local.buffer = io.StringIO()
+    try:
+        # 비동기 테스트는 공용 이벤트 루프에서 실행 (루프를 쓰는 테스트는 DB 연결 하나뿐)
+        if asyncio.iscoroutinefunction(test_func):
+            result = _LOOP.run_until_complete(test_func())
+        else:
+            result = test_func()
+    finally:
+        del _stdout_local.buffer
+    return result, buffer.getvalue()
+
+
 def main():
     """메인 테스트 함수"""
     print("🚀 FastAPI 백엔드 설정 테스트 시작\n")
     
-    tests = [
-        ("모듈 Import", test_imports),
-        ("설정 로드", test_config),
-        ("모델 생성", test_models),
-        ("스키마 검증", test_schemas),
-        ("데이터베이스 연결", test_database_connection)
-    ]
-    
-    results = []
-    
-    for test_name, test_func in tests:
-        result = test_func()
-        results.append((test_name, result))
-    
-    # 결과 요약
-    print("\n" + "="*50)
-    print("📊 테스트 결과 요약")
-    print("="*50)
-    
-    passed = 0
-    failed = 0
-    skipped = 0
-    
-    for test_name, result in results:
-        if result is True:
-            print(f"✅ {test_name}: 통과")
-            passed += 1
-        elif result is False:
-            print(f"❌ {test_name}: 실패")
-            failed += 1
-        else:
-            print(f"⚠️ {test_name}: 건너뜀")
-            skipped += 1
+    # 실행과 동시에 결과 집계 (True=통과, False=실패, None=건너뜀)
+    counter = Counter()
+    rows = []
     
-    print(f"\n📈 총 {len(results)}개 테스트 중:")
-    print(f"   ✅ 통과: {passed}개")
-    print(f"   ❌ 실패: {failed}개")
-    print(f"   ⚠️ 건너뜀: {skipped}개")
+    # 모듈 import 테스트는 먼저 직렬로 실행해 앱 모듈 로드를 끝냄
+    # (app.core.config 는 Secrets Manager 호출 후에야 settings 를 바인딩하므로, 병렬 실행 시 초기화 중인 모듈을 볼 수 있음)
+    # 나머지 테스트는 서로 독립적이므로 병렬 실행 (DB 연결 대기 시간을 다른 테스트와 겹침)
+    # 출력은 완료 순서가 아닌 TESTS 순서대로 내보내 로그가 항상 같은 모양이 되도록 함
+    real_stdout = sys.stdout
+    sys.stdout = _ThreadLocalStdout(real_stdout)
+    try:
+        outcomes = {test_imports: _run_buffered(test_imports)}
+        with ThreadPoolExecutor(max_workers=len(TESTS)) as executor:
+            futures = {
+                test_func: executor.submit(_run_buffered, test_func)
+                for _, test_func in TESTS
+                if test_func not in outcomes
+            }
+            for test_name, test_func in TESTS:
+                result, output = outcomes[test_func] if test_func in outcomes else futures[test_func].result()
+                real_stdout.write(output)
+                real_stdout.flush()
+                counter[result] += 1
+                rows.append(_STATUS_FORMATS[result].format(test_name))
+    finally:
+        sys.stdout = real_stdout
+    
+    passed, failed, skipped = counter[True], counter[False], counter[None]
+    
+    # 결과 요약 (한 번에 출력)
+    out = ["", "="*50, "📊 테스트 결과 요약", "="*50, *rows]
+    
+    out.append(
+        f"\n📈 총 {len(rows)}개 테스트 중:\n"
+        f"   {_OK} 통과: {passed}개\n"
+        f"   {_FAIL} 실패: {failed}개\n"
+        f"   {_WARN} 건너뜀: {skipped}개"
+    )
     
     if failed == 0:
-        print("\n🎉 모든 필수 테스트가 통과했습니다!")
-        print("💡 다음 단계:")
-        print("   1. .env 파일 설정")
-        print("   2. PostgreSQL 데이터베이스 생성")
-        print("   3. python run_server.py 실행")
+        out.append(
+            "\n🎉 모든 필수 테스트가 통과했습니다!\n"
+            "💡 다음 단계:\n"
+            "   1. .env 파일 설정\n"
+            "   2. PostgreSQL 데이터베이스 생성\n"
+            "   3. python run_server.py 실행"
+        )
     else:
-        print(f"\n⚠️ {failed}개의 테스트가 실패했습니다.")
-        print("💡 requirements.txt의 패키지들을 설치했는지 확인하세요:")
-        print("   pip install -r requirements.txt")
+        out.append(
+            f"\n{_WARN} {failed}개의 테스트가 실패했습니다.\n"
+            "💡 requirements.txt의 패키지들을 설치했는지 확인하세요:\n"
+            "   pip install -r requirements.txt"
+        )
+    
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
     
     return failed == 0
 
 
 if __name__ == "__main__":
-    success = main()
+    try:
+        success = main()
+    finally:
+        # main() 은 반복 호출될 수 있으므로 공용 이벤트 루프는 스크립트 종료 시에만 닫음
+        _LOOP.close()
     sys.exit(0 if success else 1)
\ No newline at end of file